@@ -0,0 +1,45 @@
+"""Replace word_text unique constraint with a covering unique index
+
+Revision ID: 5b8f0e3d7c16
+Revises: c41e8d2f5a07
+Create Date: 2026-10-15 14:51:07.362918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b8f0e3d7c16'
+down_revision: Union[str, None] = 'c41e8d2f5a07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The word lookup only reads id and language from words, so carrying them
+    # in the unique index turns it into an index-only scan. last_enriched_at
+    # is left out: it is updated after insert, and indexing it would rule out
+    # HOT updates. The new index enforces uniqueness before the old
+    # constraint is dropped, so word_text is never unprotected.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'uq_words_word_text_covering',
+            'words',
+            ['word_text'],
+            unique=True,
+            postgresql_include=['id', 'language'],
+            postgresql_concurrently=True,
+        )
+    op.drop_constraint('words_word_text_key', 'words', type_='unique')
+
+
+def downgrade() -> None:
+    op.create_unique_constraint('words_word_text_key', 'words', ['word_text'])
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'uq_words_word_text_covering',
+            table_name='words',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,41 @@
+"""Replace word_text regex check with plain string checks
+
+Revision ID: 6c960e472ba5
+Revises: ba95e36a63f5
+Create Date: 2026-10-15 09:47:21.903316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6c960e472ba5'
+down_revision: Union[str, None] = 'ba95e36a63f5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Same rule as '^[a-z]+(-[a-z]+)*$' (letters separated by single hyphens),
+    # checked with linear string functions instead of the regex engine
+    op.drop_constraint('check_word_text_pattern', 'words', type_='check')
+    op.create_check_constraint(
+        'check_word_text_pattern',
+        'words',
+        "word_text <> '' "
+        "AND translate(word_text, 'abcdefghijklmnopqrstuvwxyz-', '') = '' "
+        "AND left(word_text, 1) <> '-' "
+        "AND right(word_text, 1) <> '-' "
+        "AND strpos(word_text, '--') = 0",
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('check_word_text_pattern', 'words', type_='check')
+    op.create_check_constraint(
+        'check_word_text_pattern',
+        'words',
+        "word_text ~ '^[a-z]+(-[a-z]+)*$'",
+    )
@@ -0,0 +1,74 @@
+"""Use enum types for learning metadata levels and bands
+
+Revision ID: 7e2a4c6b91d3
+Revises: 3d7f1c9a2b84
+Create Date: 2026-10-15 13:26:40.518274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e2a4c6b91d3'
+down_revision: Union[str, None] = '3d7f1c9a2b84'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+CEFR_LEVELS = ('A1', 'A2', 'B1', 'B2', 'C1', 'C2')
+FREQUENCY_BANDS = ('top-100', 'top-1000', 'top-5000', 'top-10000', 'rare', 'very-rare')
+
+cefr_level_t = postgresql.ENUM(*CEFR_LEVELS, name='cefr_level_t')
+frequency_band_t = postgresql.ENUM(*FREQUENCY_BANDS, name='frequency_band_t')
+
+# (column, old type, enum type, check constraint it replaces)
+ENUM_COLUMNS = (
+    ('difficulty_level', sa.String(length=10), cefr_level_t, 'check_difficulty_level'),
+    ('cefr_level', sa.String(length=5), cefr_level_t, 'check_cefr_level'),
+    ('frequency_band', sa.String(length=20), frequency_band_t, 'check_frequency_band'),
+)
+
+
+def upgrade() -> None:
+    # The enum types enforce the allowed values themselves (4-byte values
+    # instead of text), so the IN (...) check constraints go away
+    bind = op.get_bind()
+    cefr_level_t.create(bind, checkfirst=False)
+    frequency_band_t.create(bind, checkfirst=False)
+
+    for column, old_type, enum_type, constraint in ENUM_COLUMNS:
+        op.drop_constraint(constraint, 'learning_metadata', type_='check')
+        op.alter_column(
+            'learning_metadata',
+            column,
+            existing_type=old_type,
+            type_=enum_type,
+            existing_nullable=True,
+            postgresql_using=f'{column}::{enum_type.name}',
+        )
+
+
+def downgrade() -> None:
+    for column, old_type, enum_type, constraint in ENUM_COLUMNS:
+        op.alter_column(
+            'learning_metadata',
+            column,
+            existing_type=enum_type,
+            type_=old_type,
+            existing_nullable=True,
+            postgresql_using=f'{column}::text',
+        )
+        allowed = ', '.join(f"'{value}'" for value in enum_type.enums)
+        op.create_check_constraint(
+            constraint,
+            'learning_metadata',
+            f'{column} IN ({allowed}) OR {column} IS NULL',
+        )
+
+    bind = op.get_bind()
+    frequency_band_t.drop(bind, checkfirst=False)
+    cefr_level_t.drop(bind, checkfirst=False)
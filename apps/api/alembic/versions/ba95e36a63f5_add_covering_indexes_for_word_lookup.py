@@ -0,0 +1,79 @@
+"""Add covering indexes for word lookup
+
+Revision ID: ba95e36a63f5
+Revises: ea8a5178aa8b
+Create Date: 2026-10-15 09:12:44.518203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ba95e36a63f5'
+down_revision: Union[str, None] = 'ea8a5178aa8b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covering indexes let the word lookup read definitions and related words
+    # with index-only scans. They have the same key columns as the indexes they
+    # replace, so the old ones are dropped. Unbounded text columns (usage_notes)
+    # are left out of INCLUDE to stay under the B-tree tuple size limit.
+    # These tables are already populated, so build and drop CONCURRENTLY
+    # (outside the migration transaction) to avoid blocking writes.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_definitions_word_order_covering',
+            'definitions',
+            ['word_id', 'order_index'],
+            postgresql_include=['part_of_speech', 'definition_text'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_definitions_word_order',
+            table_name='definitions',
+            postgresql_concurrently=True,
+        )
+
+        op.create_index(
+            'idx_related_words_source_type_covering',
+            'related_words',
+            ['source_word_id', 'relationship_type'],
+            postgresql_include=['target_word_id', 'strength'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_related_words_source_type',
+            table_name='related_words',
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'idx_related_words_source_type',
+            'related_words',
+            ['source_word_id', 'relationship_type'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_related_words_source_type_covering',
+            table_name='related_words',
+            postgresql_concurrently=True,
+        )
+
+        op.create_index(
+            'idx_definitions_word_order',
+            'definitions',
+            ['word_id', 'order_index'],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'idx_definitions_word_order_covering',
+            table_name='definitions',
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,69 @@
+"""Store style tags as a bitmask
+
+Revision ID: c41e8d2f5a07
+Revises: 7e2a4c6b91d3
+Create Date: 2026-10-15 14:08:52.174903
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e8d2f5a07'
+down_revision: Union[str, None] = '7e2a4c6b91d3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Snapshot of STYLE_TAGS at this revision; bit N is element N + 1
+STYLE_TAGS = (
+    'formal', 'informal', 'technical', 'archaic',
+    'slang', 'literary', 'regional', 'offensive',
+)
+STYLE_TAGS_SQL = 'ARRAY[' + ', '.join(f"'{tag}'" for tag in STYLE_TAGS) + ']'
+
+
+def upgrade() -> None:
+    # style_tags is dropped below and tags without a bit cannot be restored
+    # by downgrade, so refuse to migrate rather than lose them silently
+    unknown_tags = op.get_bind().execute(sa.text(
+        'SELECT DISTINCT tag FROM learning_metadata, unnest(style_tags) AS tag '
+        f'WHERE NOT tag = ANY({STYLE_TAGS_SQL}) ORDER BY tag'
+    )).scalars().all()
+    if unknown_tags:
+        raise RuntimeError(
+            f"learning_metadata.style_tags has tags outside STYLE_TAGS: {unknown_tags}. "
+            "Add them to STYLE_TAGS (here and in src/models/learning_metadata.py) "
+            "or remove them before upgrading."
+        )
+
+    op.add_column(
+        'learning_metadata',
+        sa.Column('style_tag_mask', sa.SmallInteger(), server_default='0', nullable=False),
+    )
+    op.execute(
+        'UPDATE learning_metadata SET style_tag_mask = ('
+        'SELECT COALESCE(sum(1 << (t.bit::int - 1)), 0)::smallint '
+        f'FROM unnest({STYLE_TAGS_SQL}) WITH ORDINALITY AS t(tag, bit) '
+        'WHERE t.tag = ANY(style_tags)'
+        ') WHERE style_tags IS NOT NULL'
+    )
+    op.drop_column('learning_metadata', 'style_tags')
+
+
+def downgrade() -> None:
+    op.add_column(
+        'learning_metadata',
+        sa.Column('style_tags', sa.ARRAY(sa.String()), nullable=True),
+    )
+    op.execute(
+        'UPDATE learning_metadata SET style_tags = ARRAY('
+        f'SELECT t.tag FROM unnest({STYLE_TAGS_SQL}) WITH ORDINALITY AS t(tag, bit) '
+        'WHERE style_tag_mask & (1 << (t.bit::int - 1)) <> 0 '
+        'ORDER BY t.bit'
+        ')::varchar[]'
+    )
+    op.drop_column('learning_metadata', 'style_tag_mask')
@@ -0,0 +1,35 @@
+"""Drop unique indexes duplicated by unique constraints
+
+Revision ID: fbfed1755655
+Revises: 6c960e472ba5
+Create Date: 2026-10-15 10:05:37.211480
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fbfed1755655'
+down_revision: Union[str, None] = '6c960e472ba5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Each of these duplicates the unique index Postgres already builds for the
+    # column's UNIQUE constraint, doubling index maintenance on every insert
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_words_word_text', table_name='words', postgresql_concurrently=True)
+        op.drop_index('idx_phonetic_word_id', table_name='phonetic_representations', postgresql_concurrently=True)
+        op.drop_index('idx_grammatical_word_id', table_name='grammatical_information', postgresql_concurrently=True)
+        op.drop_index('idx_learning_metadata_word_id', table_name='learning_metadata', postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index('idx_learning_metadata_word_id', 'learning_metadata', ['word_id'], unique=True, postgresql_concurrently=True)
+        op.create_index('idx_grammatical_word_id', 'grammatical_information', ['word_id'], unique=True, postgresql_concurrently=True)
+        op.create_index('idx_phonetic_word_id', 'phonetic_representations', ['word_id'], unique=True, postgresql_concurrently=True)
+        op.create_index('ix_words_word_text', 'words', ['word_text'], unique=True, postgresql_concurrently=True)
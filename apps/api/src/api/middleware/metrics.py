@@ -1,10 +1,9 @@
-"""Prometheus metrics middleware for monitoring API performance."""
+"""Prometheus metrics definitions and exposition endpoint."""
+import asyncio
 import time
-from typing import Callable
 
-from fastapi import Request, Response
+from fastapi import Request
 from prometheus_client import Counter, Histogram, Gauge, generate_latest, CONTENT_TYPE_LATEST
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import Response as StarletteResponse
 
 
@@ -51,90 +50,102 @@ error_responses_total = Counter(
 )
 
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    """Middleware to collect Prometheus metrics for all requests."""
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request and collect metrics."""
-        # Skip metrics collection for the metrics endpoint itself
-        if request.url.path == "/metrics":
-            return await call_next(request)
-
-        # Track in-progress requests
-        http_requests_in_progress.inc()
-
-        # Record start time
-        start_time = time.time()
-
-        try:
-            # Process request
-            response = await call_next(request)
-
-            # Calculate duration
-            duration = time.time() - start_time
-
-            # Get endpoint path (without query params)
-            endpoint = request.url.path
-            method = request.method
-
-            # Record metrics
-            http_requests_total.labels(
-                method=method,
-                endpoint=endpoint,
-                status_code=response.status_code
-            ).inc()
-
-            http_request_duration_seconds.labels(
-                method=method,
-                endpoint=endpoint
-            ).observe(duration)
-
-            # Track cache hits/misses if header is present
-            if "X-Cache-Status" in response.headers:
-                cache_status = response.headers["X-Cache-Status"]
-                if cache_status == "HIT":
-                    cache_hits_total.labels(endpoint=endpoint).inc()
-                elif cache_status == "MISS":
-                    cache_misses_total.labels(endpoint=endpoint).inc()
-
-            # Track error responses
-            if response.status_code >= 400:
-                error_type = "client_error" if response.status_code < 500 else "server_error"
-                error_responses_total.labels(
-                    endpoint=endpoint,
-                    error_type=error_type
-                ).inc()
-
-            return response
-
-        except Exception as e:
-            # Record exception
-            duration = time.time() - start_time
-            endpoint = request.url.path
-            method = request.method
-
-            http_request_duration_seconds.labels(
-                method=method,
-                endpoint=endpoint
-            ).observe(duration)
+class HistogramBuffer:
+    """
+    Buffers histogram observations and applies them to the histogram in batches.
 
-            error_responses_total.labels(
-                endpoint=endpoint,
-                error_type="exception"
-            ).inc()
+    Histogram.observe() takes a threading lock for the sum and for the matching
+    bucket. The event loop is single-threaded, so the request path can append
+    to a plain list instead and leave the locked updates to flush(), which runs
+    periodically in a background task and before each /metrics render.
+    """
 
-            # Re-raise exception
-            raise
+    # Flush inline once this many observations are buffered, so the buffer
+    # stays bounded even if the background flusher is not running
+    MAX_PENDING = 10_000
+
+    def __init__(self, histogram: Histogram):
+        self._histogram = histogram
+        self._pending: dict[tuple, list[float]] = {}
+        self._pending_count = 0
+        self._children: dict[tuple, Histogram] = {}
+
+    def observe(self, labels: tuple, amount: float) -> None:
+        """
+        Buffer an observation.
+
+        Args:
+            labels: Label values, in the histogram's label order
+            amount: Observed value
+        """
+        pending = self._pending.get(labels)
+        if pending is None:
+            self._pending[labels] = [amount]
+        else:
+            pending.append(amount)
+        self._pending_count += 1
+        if self._pending_count >= self.MAX_PENDING:
+            self.flush()
+
+    def flush(self) -> None:
+        """Apply all buffered observations to the histogram."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        self._pending_count = 0
+        for labels, amounts in pending.items():
+            child = self._children.get(labels)
+            if child is None:
+                child = self._histogram.labels(*labels)
+                self._children[labels] = child
+            for amount in amounts:
+                child.observe(amount)
+
+
+http_request_duration_buffer = HistogramBuffer(http_request_duration_seconds)
+
+# How often buffered histogram observations are applied (seconds)
+METRICS_FLUSH_INTERVAL_SECONDS = 1.0
+
+
+async def run_metrics_flusher() -> None:
+    """Periodically apply buffered histogram observations until cancelled."""
+    try:
+        while True:
+            await asyncio.sleep(METRICS_FLUSH_INTERVAL_SECONDS)
+            http_request_duration_buffer.flush()
+    finally:
+        http_request_duration_buffer.flush()
+
+
+# How long a rendered /metrics payload is reused (seconds). Scrapes from several
+# Prometheus servers within this window share one generate_latest() call.
+METRICS_CACHE_TTL_SECONDS = 1.0
+
+_metrics_cache_ts: float = float("-inf")
+_metrics_cache_payload: bytes = b""
+
+
+def get_metrics_payload() -> bytes:
+    """
+    Get the rendered Prometheus exposition payload, reusing a recent render.
 
-        finally:
-            # Decrement in-progress counter
-            http_requests_in_progress.dec()
+    Returns:
+        Metrics in Prometheus text format, at most METRICS_CACHE_TTL_SECONDS old
+    """
+    global _metrics_cache_ts, _metrics_cache_payload
+    now = time.monotonic()
+    if now - _metrics_cache_ts >= METRICS_CACHE_TTL_SECONDS:
+        http_request_duration_buffer.flush()
+        _metrics_cache_payload = generate_latest()
+        _metrics_cache_ts = now
+    return _metrics_cache_payload
 
 
 async def metrics_endpoint(request: Request) -> StarletteResponse:
     """Expose Prometheus metrics at /metrics endpoint."""
     return StarletteResponse(
-        content=generate_latest(),
+        content=get_metrics_payload(),
         media_type=CONTENT_TYPE_LATEST
     )
 
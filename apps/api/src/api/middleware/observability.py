@@ -0,0 +1,216 @@
+"""Request ID tracing and Prometheus metrics middleware."""
+import time
+from typing import Optional
+
+from loguru import logger
+from prometheus_client import Counter
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.middleware.metrics import (
+    cache_hits_total,
+    cache_misses_total,
+    error_responses_total,
+    http_request_duration_buffer,
+    http_requests_in_progress,
+    http_requests_total,
+)
+from src.api.middleware.request_id import generate_request_id
+
+
+class ObservabilityMiddleware:
+    """
+    Pure ASGI middleware handling request ID tracing and Prometheus metrics.
+
+    Replaces separate BaseHTTPMiddleware subclasses, which each spawn a task
+    group and a memory stream per request, with a single pass over the
+    request that wraps `send` to observe the response start.
+
+    For each HTTP request it:
+    1. Takes the request ID from the X-Request-ID header or generates a new one
+    2. Stores it in request state and the log context
+    3. Adds it to the response headers
+    4. Records request count, latency, cache status and error metrics,
+       labelled by route template
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Initialize middleware with empty caches of bound metric children."""
+        self.app = app
+        # Bound metric children keyed by label values, so the hot path skips
+        # the registry's per-call label hashing and child lookup
+        self._req_total_cache: dict[tuple, Counter] = {}
+        self._error_cache: dict[tuple, Counter] = {}
+        self._cache_hit_cache: dict[str, Counter] = {}
+        self._cache_miss_cache: dict[str, Counter] = {}
+
+    def _req_child(self, method: str, endpoint: str, status_code: int) -> Counter:
+        """Get the bound request counter child for a label set."""
+        key = (method, endpoint, status_code)
+        child = self._req_total_cache.get(key)
+        if child is None:
+            child = http_requests_total.labels(method, endpoint, status_code)
+            self._req_total_cache[key] = child
+        return child
+
+    def _error_child(self, endpoint: str, error_type: str) -> Counter:
+        """Get the bound error counter child for a label set."""
+        key = (endpoint, error_type)
+        child = self._error_cache.get(key)
+        if child is None:
+            child = error_responses_total.labels(endpoint, error_type)
+            self._error_cache[key] = child
+        return child
+
+    def _cache_status_child(self, endpoint: str, hit: bool) -> Counter:
+        """Get the bound cache hit/miss counter child for an endpoint."""
+        cache = self._cache_hit_cache if hit else self._cache_miss_cache
+        child = cache.get(endpoint)
+        if child is None:
+            metric = cache_hits_total if hit else cache_misses_total
+            child = metric.labels(endpoint)
+            cache[endpoint] = child
+        return child
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process an ASGI request, tracing it and collecting metrics."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        path = scope["path"]
+
+        # Get or generate request ID
+        request_id = Headers(scope=scope).get("x-request-id")
+        if not request_id:
+            request_id = generate_request_id()
+
+        # Add request ID to request state for access in route handlers
+        scope.setdefault("state", {})["request_id"] = request_id
+
+        # Skip metrics collection for the metrics endpoint itself
+        collect_metrics = path != "/metrics"
+        status_code = None
+        endpoint = None
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, endpoint
+
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = MutableHeaders(scope=message)
+
+                # Add request ID to response headers
+                headers["X-Request-ID"] = request_id
+
+                if collect_metrics:
+                    # Label by route template (e.g. /api/v1/words/{word}) rather than
+                    # the raw path, so series count is bounded by the number of routes.
+                    # Unmatched paths (404 from the router) are not recorded at all.
+                    endpoint = get_route_template(scope)
+                    if endpoint is not None:
+                        self._record_response(method, endpoint, status_code, headers.raw)
+
+            await send(message)
+
+        # Add request ID to log context
+        with logger.contextualize(request_id=request_id):
+            # Message templates are formatted by loguru only if the record passes
+            # the level filter; the keyword arguments also land in record["extra"]
+            logger.info(
+                "Request started: {method} {path}",
+                method=method,
+                path=path,
+                client_host=scope["client"][0] if scope.get("client") else None,
+            )
+
+            if collect_metrics:
+                # Track in-progress requests
+                http_requests_in_progress.inc()
+
+            # Record start time (monotonic clock, immune to wall-clock adjustments)
+            start_time = time.perf_counter()
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+
+            except Exception as e:
+                if collect_metrics:
+                    # Record exception (latency is recorded in the finally block)
+                    endpoint = get_route_template(scope)
+                    if endpoint is not None:
+                        self._error_child(endpoint, "exception").inc()
+
+                logger.exception(
+                    "Request failed: {method} {path} - {error}",
+                    method=method,
+                    path=path,
+                    error=str(e),
+                )
+                raise
+
+            finally:
+                if collect_metrics:
+                    if endpoint is not None:
+                        # Buffered; applied to the histogram off the request path
+                        http_request_duration_buffer.observe(
+                            (method, endpoint),
+                            time.perf_counter() - start_time
+                        )
+
+                    # Decrement in-progress counter
+                    http_requests_in_progress.dec()
+
+            logger.info(
+                "Request completed: {method} {path} - {status_code}",
+                method=method,
+                path=path,
+                status_code=status_code,
+            )
+
+    def _record_response(
+        self,
+        method: str,
+        endpoint: str,
+        status_code: int,
+        raw_headers: list[tuple[bytes, bytes]]
+    ) -> None:
+        """
+        Record request count, cache status and error metrics for a response.
+
+        Args:
+            method: HTTP method
+            endpoint: Route path template
+            status_code: Response status code
+            raw_headers: Raw ASGI response header list (lowercase names)
+        """
+        self._req_child(method, endpoint, status_code).inc()
+
+        # Track cache hits/misses if header is present. Compare the raw bytes
+        # directly rather than going through a decoded, case-folded Headers lookup.
+        for name, value in raw_headers:
+            if name == b"x-cache-status":
+                if value == b"HIT":
+                    self._cache_status_child(endpoint, hit=True).inc()
+                elif value == b"MISS":
+                    self._cache_status_child(endpoint, hit=False).inc()
+                break
+
+        # Track error responses
+        if status_code >= 400:
+            error_type = "client_error" if status_code < 500 else "server_error"
+            self._error_child(endpoint, error_type).inc()
+
+
+def get_route_template(scope: Scope) -> Optional[str]:
+    """
+    Get the path template of the route that handled the request.
+
+    Args:
+        scope: ASGI scope (after routing)
+
+    Returns:
+        Route path template (e.g., "/api/v1/words/{word}"), or None if no route matched
+    """
+    return getattr(scope.get("route"), "path", None)
@@ -1,72 +1,24 @@
-"""Request ID tracing middleware."""
-import uuid
-from typing import Callable
+"""Request ID generation and lookup helpers."""
+import os
 
-from fastapi import Request, Response
-from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import Request
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Middleware to add unique request IDs for tracing."""
-
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """
-        Add a unique request ID to each request.
-
-        The request ID is:
-        1. Taken from X-Request-ID header if provided
-        2. Generated as a new UUID if not provided
-        3. Added to the response headers
-        4. Added to log context for all logs during request processing
-        """
-        # Get or generate request ID
-        request_id = request.headers.get("X-Request-ID")
-        if not request_id:
-            request_id = str(uuid.uuid4())
-
-        # Add request ID to request state for access in route handlers
-        request.state.request_id = request_id
-
-        # Add request ID to log context
-        with logger.contextualize(request_id=request_id):
-            logger.info(
-                f"Request started: {request.method} {request.url.path}",
-                extra={
-                    "method": request.method,
-                    "path": request.url.path,
-                    "client_host": request.client.host if request.client else None,
-                }
-            )
-
-            try:
-                # Process request
-                response = await call_next(request)
-
-                # Add request ID to response headers
-                response.headers["X-Request-ID"] = request_id
-
-                logger.info(
-                    f"Request completed: {request.method} {request.url.path} - {response.status_code}",
-                    extra={
-                        "method": request.method,
-                        "path": request.url.path,
-                        "status_code": response.status_code,
-                    }
-                )
+def generate_request_id() -> str:
+    """
+    Generate a random UUID4-formatted request ID.
 
-                return response
+    Equivalent to str(uuid.uuid4()) but formats the random bytes directly,
+    skipping construction of a UUID object on every request.
 
-            except Exception as e:
-                logger.error(
-                    f"Request failed: {request.method} {request.url.path} - {str(e)}",
-                    extra={
-                        "method": request.method,
-                        "path": request.url.path,
-                        "error": str(e),
-                    }
-                )
-                raise
+    Returns:
+        Request ID string (e.g., "3f2b8c1e-9a4d-4e7f-b2c1-5d6e7f8a9b0c")
+    """
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40  # Version 4
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 def get_request_id(request: Request) -> str:
@@ -1,5 +1,5 @@
 """Health check endpoint."""
-from datetime import datetime
+from datetime import UTC, datetime
 
 from fastapi import APIRouter, Depends, status
 from redis.asyncio import Redis
@@ -30,7 +30,7 @@ async def health_check(
     """
     health_status = {
         "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": datetime.now(UTC).replace(tzinfo=None).isoformat() + "Z",
         "services": {}
     }
 
@@ -14,17 +14,9 @@ from src.services.word_service import WordService
 from src.api.v1.models.responses import (
     WordResponse,
     ErrorResponse,
-    WordNotFoundResponse,
-    DefinitionSchema,
-    PhoneticSchema,
-    GrammaticalInfoSchema,
-    LearningMetadataSchema,
-    RelatedWordSchema,
-    DataCompletenessSchema,
-    VerbFormsSchema,
-    AdjectiveFormsSchema,
-    UsageExampleSchema
+    WordNotFoundResponse
 )
+from src.api.v1.responses import PydanticJSONResponse
 from src.api.middleware.error_handlers import (
     WordNotFoundException,
     InvalidWordFormatException
@@ -34,8 +26,11 @@ from src.api.middleware.rate_limit import limiter
 # Create router
 router = APIRouter()
 
-# Word validation pattern
-WORD_PATTERN = re.compile(r'^[a-z]+(-[a-z]+)*$')
+# Word validation pattern (applied with fullmatch, so no anchors needed)
+WORD_PATTERN = re.compile(r'[a-z]+(?:-[a-z]+)*')
+
+# Maximum word length (matches words.word_text column size)
+MAX_WORD_LENGTH = 100
 
 
 def normalize_word(word: str) -> str:
@@ -54,16 +49,28 @@ def normalize_word(word: str) -> str:
     # Strip whitespace and convert to lowercase
     normalized = word.strip().lower()
 
+    # Cheap prefilter: reject overlong or non-ASCII input before running the regex
+    if len(normalized) > MAX_WORD_LENGTH or not normalized.isascii():
+        raise InvalidWordFormatException(normalized)
+
     # Validate pattern
-    if not WORD_PATTERN.match(normalized):
+    if not WORD_PATTERN.fullmatch(normalized):
         raise InvalidWordFormatException(normalized)
 
     return normalized
 
 
+# Shared service instances (built on first use rather than per request)
+_enrichment_service: Optional[EnrichmentService] = None
+_cache_service: Optional[CacheService] = None
+
+
 def get_enrichment_service() -> EnrichmentService:
-    """Dependency for getting EnrichmentService instance."""
-    return EnrichmentService()
+    """Dependency for getting the shared EnrichmentService instance."""
+    global _enrichment_service
+    if _enrichment_service is None:
+        _enrichment_service = EnrichmentService()
+    return _enrichment_service
 
 
 async def get_word_service(
@@ -82,13 +89,17 @@ async def get_word_service(
     Returns:
         WordService instance
     """
-    cache_service = CacheService(redis)
-    return WordService(db, cache_service, enrichment_service)
+    global _cache_service
+    # Rebuild only if the Redis client was replaced (e.g. after close_redis)
+    if _cache_service is None or _cache_service.redis is not redis:
+        _cache_service = CacheService(redis)
+    return WordService(db, _cache_service, enrichment_service)
 
 
 @router.get(
     "/words/{word}",
     response_model=WordResponse,
+    response_class=PydanticJSONResponse,
     status_code=status.HTTP_200_OK,
     responses={
         400: {"model": ErrorResponse, "description": "Invalid word format"},
@@ -114,7 +125,6 @@ async def get_word_service(
 async def lookup_word(
     request: Request,
     word: str,
-    response: Response,
     include_examples: bool = Query(
         default=True,
         description="Include usage examples in the response"
@@ -131,7 +141,6 @@ async def lookup_word(
     Args:
         request: FastAPI request object (for rate limiting)
         word: Word to look up (path parameter)
-        response: FastAPI response object (for headers)
         include_examples: Whether to include usage examples
         include_related: Whether to include related words
         word_service: Word service dependency
@@ -151,149 +160,105 @@ async def lookup_word(
 
     logger.info(f"Word lookup request: {normalized_word}")
 
-    # Perform lookup
-    try:
-        word_data = await word_service.lookup_word(normalized_word)
-    except WordNotFoundException:
-        # T043: Handle 404 with suggestions (placeholder for now)
-        raise
-
-    # T041: Add X-Cache-Status header
-    cache_status = word_data.pop("_cache_status", "MISS")
-    response.headers["X-Cache-Status"] = cache_status
-
-    # T042: Rate limit headers are automatically added by slowapi
-    # slowapi automatically adds X-RateLimit-Remaining and X-RateLimit-Reset headers
-
-    # Filter response based on query parameters
-    if not include_examples:
-        # Remove examples from all definitions
-        for definition in word_data.get("definitions", []):
-            definition["examples"] = []
-    # Note: include_examples parameter is respected here, filtering examples before response conversion
+    # Full responses (no sections filtered out) are cached already rendered,
+    # so a hit is returned as-is without decoding or validating anything
+    full_response = include_examples and include_related
+    if full_response:
+        cached_body = await word_service.get_cached_response(normalized_word)
+        if cached_body is not None:
+            # T041: Add X-Cache-Status header
+            return Response(
+                content=cached_body,
+                media_type="application/json",
+                headers={"X-Cache-Status": "HIT"}
+            )
 
-    if not include_related:
-        # Remove related words
-        word_data["related_words"] = []
+    # Filtering by query parameters happens during validation
+    context = {
+        "include_examples": include_examples,
+        "include_related": include_related
+    }
+
+    # Cache hit: validate the cached JSON straight into the response model
+    cached_json = await word_service.get_cached_word_json(normalized_word)
+    if cached_json is not None:
+        # T041: Add X-Cache-Status header
+        word_response = WordResponse.model_validate_json(cached_json, context=context)
+        headers = {"X-Cache-Status": "HIT"}
+        cacheable = True
+    else:
+        # Perform lookup
+        try:
+            word_data = await word_service.lookup_word(normalized_word, check_cache=False)
+        except WordNotFoundException:
+            # T043: Handle 404 with suggestions (placeholder for now)
+            raise
+
+        # T041: Add X-Cache-Status header
+        cache_status = word_data.pop("_cache_status", "MISS")
+        headers = {"X-Cache-Status": cache_status}
+
+        # T042: Rate limit headers are automatically added by slowapi
+        # slowapi automatically adds X-RateLimit-Remaining and X-RateLimit-Reset headers
+
+        # Convert to response model. Data read back from the database was validated
+        # on write, so build it without validation; fall back to full validation for
+        # enrichment output that could not be stored (and is not cached either).
+        if word_data.pop("_storage_failed", False):
+            word_response = _convert_to_response(
+                word_data,
+                include_examples=include_examples,
+                include_related=include_related
+            )
+            cacheable = False
+        else:
+            word_response = WordResponse.from_word_data(
+                word_data,
+                include_examples=include_examples,
+                include_related=include_related
+            )
+            cacheable = True
+
+    # The model is returned in a PydanticJSONResponse so FastAPI serializes it
+    # once, rather than dumping and re-validating it against response_model.
+    json_response = PydanticJSONResponse(word_response, headers=headers)
+
+    if full_response and cacheable:
+        frequency_rank = None
+        if word_response.learning_metadata:
+            frequency_rank = word_response.learning_metadata.frequency_rank
+        await word_service.cache_response(
+            normalized_word,
+            json_response.body,
+            frequency_rank=frequency_rank
+        )
 
-    # Convert to response model
-    return _convert_to_response(word_data)
+    return json_response
 
 
-def _convert_to_response(word_data: dict) -> WordResponse:
+def _convert_to_response(
+    word_data: dict,
+    include_examples: bool = True,
+    include_related: bool = True
+) -> WordResponse:
     """
     Convert word data dictionary to WordResponse model.
 
+    Excluded sections are skipped outright rather than being validated and
+    then discarded.
+
     Args:
         word_data: Word data from service
+        include_examples: Whether to include usage examples
+        include_related: Whether to include related words
 
     Returns:
         WordResponse model
     """
-    # Build phonetic schema
-    phonetic = None
-    if word_data.get("phonetic"):
-        phonetic = PhoneticSchema(
-            ipa_transcription=word_data["phonetic"]["ipa_transcription"],
-            audio_url=word_data["phonetic"].get("audio_url")
-        )
-
-    # Build definition schemas
-    definitions = []
-    for def_data in word_data.get("definitions", []):
-        # Build usage example schemas
-        examples = []
-        for ex_data in def_data.get("examples", []):
-            if isinstance(ex_data, dict):
-                examples.append(UsageExampleSchema(
-                    example_text=ex_data.get("example_text", ""),
-                    context_type=ex_data.get("context_type")
-                ))
-            elif isinstance(ex_data, str):
-                # Backward compatibility: convert string examples
-                examples.append(UsageExampleSchema(
-                    example_text=ex_data,
-                    context_type="casual"
-                ))
-
-        definitions.append(DefinitionSchema(
-            definition_text=def_data["definition_text"],
-            part_of_speech=def_data["part_of_speech"],
-            usage_context=def_data.get("usage_context"),
-            examples=examples
-        ))
-
-    # Build grammatical info schema
-    grammatical_info = None
-    if word_data.get("grammatical_info"):
-        gram = word_data["grammatical_info"]
-
-        verb_forms = None
-        if any([gram.get("verb_base"), gram.get("verb_past_simple"),
-                gram.get("verb_past_participle"), gram.get("verb_present_participle"),
-                gram.get("verb_third_person")]):
-            verb_forms = VerbFormsSchema(
-                verb_base=gram.get("verb_base"),
-                verb_past_simple=gram.get("verb_past_simple"),
-                verb_past_participle=gram.get("verb_past_participle"),
-                verb_present_participle=gram.get("verb_present_participle"),
-                verb_third_person=gram.get("verb_third_person")
-            )
-
-        adjective_forms = None
-        if gram.get("adj_comparative") or gram.get("adj_superlative"):
-            adjective_forms = AdjectiveFormsSchema(
-                adj_comparative=gram.get("adj_comparative"),
-                adj_superlative=gram.get("adj_superlative")
-            )
-
-        grammatical_info = GrammaticalInfoSchema(
-            part_of_speech=gram.get("part_of_speech"),
-            plural_form=gram.get("plural_form"),
-            verb_forms=verb_forms,
-            adjective_forms=adjective_forms
-        )
-
-    # Build learning metadata schema
-    learning_metadata = None
-    if word_data.get("learning_metadata"):
-        meta = word_data["learning_metadata"]
-        learning_metadata = LearningMetadataSchema(
-            difficulty_level=meta.get("difficulty_level"),
-            cefr_level=meta.get("cefr_level"),
-            frequency_rank=meta.get("frequency_rank"),
-            frequency_band=meta.get("frequency_band"),
-            style_tags=meta.get("style_tags", [])
-        )
-
-    # Build related words schemas
-    related_words = []
-    if word_data.get("related_words"):
-        for rel in word_data["related_words"]:
-            related_words.append(RelatedWordSchema(
-                word=rel["word"],
-                relationship_type=rel["relationship_type"],
-                usage_notes=rel.get("usage_notes")
-            ))
-
-    # Build data completeness schema
-    completeness_data = word_data.get("data_completeness", {
-        "missing_fields": [],
-        "completeness_percentage": 100
-    })
-    data_completeness = DataCompletenessSchema(
-        missing_fields=completeness_data["missing_fields"],
-        completeness_percentage=completeness_data["completeness_percentage"]
-    )
-
-    # Create response
-    return WordResponse(
-        word_text=word_data["word_text"],
-        language=word_data["language"],
-        phonetic=phonetic,
-        definitions=definitions,
-        grammatical_info=grammatical_info,
-        learning_metadata=learning_metadata,
-        related_words=related_words if related_words else None,
-        data_completeness=data_completeness
+    return WordResponse.model_validate(
+        word_data,
+        context={
+            "include_examples": include_examples,
+            "include_related": include_related
+        }
     )
@@ -1,7 +1,7 @@
 """Pydantic response schemas for API endpoints."""
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, ValidationInfo, field_validator, model_validator
 
 
 class UsageExampleSchema(BaseModel):
@@ -15,9 +15,7 @@ class UsageExampleSchema(BaseModel):
         description="Context category (e.g., 'academic', 'casual', 'business')"
     )
 
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class DefinitionSchema(BaseModel):
@@ -26,9 +24,8 @@ class DefinitionSchema(BaseModel):
     part_of_speech: str = Field(
         description="Part of speech (noun, verb, adjective, etc.)"
     )
-    definition: str = Field(
-        description="Clear, learner-appropriate definition",
-        alias="definition_text"
+    definition_text: str = Field(
+        description="Clear, learner-appropriate definition"
     )
     usage_context: Optional[str] = Field(
         default=None,
@@ -39,55 +36,76 @@ class DefinitionSchema(BaseModel):
         description="Usage examples (3-5 sentences) with context types"
     )
 
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
-        populate_by_name = True
+    @field_validator("examples", mode="before")
+    @classmethod
+    def coerce_string_examples(cls, value: Any, info: ValidationInfo) -> Any:
+        """
+        Accept plain string examples (backward compatibility) and examples missing text.
+
+        Returns no examples without building any when the validation context
+        has include_examples set to False.
+        """
+        if info.context and not info.context.get("include_examples", True):
+            return []
+        if not isinstance(value, list):
+            return value
+        examples = []
+        for ex in value:
+            if isinstance(ex, str):
+                examples.append({"example_text": ex, "context_type": "casual"})
+            elif isinstance(ex, dict):
+                if "example_text" not in ex:
+                    ex = {**ex, "example_text": ""}
+                examples.append(ex)
+        return examples
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class PhoneticSchema(BaseModel):
     """Phonetic representation schema."""
 
-    ipa: str = Field(
-        description="IPA phonetic transcription",
-        alias="ipa_transcription"
+    ipa_transcription: str = Field(
+        description="IPA phonetic transcription"
     )
     audio_url: Optional[str] = Field(
         default=None,
         description="URL to pronunciation audio"
     )
 
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class VerbFormsSchema(BaseModel):
     """Verb conjugation forms."""
 
-    base: Optional[str] = Field(default=None, description="Base form", alias="verb_base")
-    past_simple: Optional[str] = Field(default=None, description="Past simple tense", alias="verb_past_simple")
-    past_participle: Optional[str] = Field(default=None, description="Past participle", alias="verb_past_participle")
-    present_participle: Optional[str] = Field(default=None, description="Present participle", alias="verb_present_participle")
-    third_person: Optional[str] = Field(default=None, description="3rd person singular", alias="verb_third_person")
+    verb_base: Optional[str] = Field(default=None, description="Base form")
+    verb_past_simple: Optional[str] = Field(default=None, description="Past simple tense")
+    verb_past_participle: Optional[str] = Field(default=None, description="Past participle")
+    verb_present_participle: Optional[str] = Field(default=None, description="Present participle")
+    verb_third_person: Optional[str] = Field(default=None, description="3rd person singular")
 
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class AdjectiveFormsSchema(BaseModel):
     """Adjective comparative/superlative forms."""
 
-    comparative: Optional[str] = Field(default=None, description="Comparative form", alias="adj_comparative")
-    superlative: Optional[str] = Field(default=None, description="Superlative form", alias="adj_superlative")
+    adj_comparative: Optional[str] = Field(default=None, description="Comparative form")
+    adj_superlative: Optional[str] = Field(default=None, description="Superlative form")
 
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# Flat field names used by the service layer for word forms
+_VERB_FORM_KEYS = (
+    "verb_base",
+    "verb_past_simple",
+    "verb_past_participle",
+    "verb_present_participle",
+    "verb_third_person",
+)
+_ADJECTIVE_FORM_KEYS = ("adj_comparative", "adj_superlative")
 
 
 class GrammaticalInfoSchema(BaseModel):
@@ -110,9 +128,20 @@ class GrammaticalInfoSchema(BaseModel):
         description="Adjective forms"
     )
 
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
+    @model_validator(mode="before")
+    @classmethod
+    def nest_word_forms(cls, data: Any) -> Any:
+        """Group flat verb_*/adj_* fields (as stored) into verb_forms/adjective_forms."""
+        if not isinstance(data, dict) or "verb_forms" in data or "adjective_forms" in data:
+            return data
+        data = dict(data)
+        if any(data.get(key) for key in _VERB_FORM_KEYS):
+            data["verb_forms"] = {key: data.get(key) for key in _VERB_FORM_KEYS}
+        if any(data.get(key) for key in _ADJECTIVE_FORM_KEYS):
+            data["adjective_forms"] = {key: data.get(key) for key in _ADJECTIVE_FORM_KEYS}
+        return data
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class LearningMetadataSchema(BaseModel):
@@ -139,9 +168,7 @@ class LearningMetadataSchema(BaseModel):
         description="Stylistic usage tags"
     )
 
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class RelatedWordSchema(BaseModel):
@@ -150,19 +177,15 @@ class RelatedWordSchema(BaseModel):
     word: str = Field(
         description="Related word text"
     )
-    relationship: str = Field(
-        description="Type of relationship",
-        alias="relationship_type"
+    relationship_type: str = Field(
+        description="Type of relationship"
     )
     usage_notes: Optional[str] = Field(
         default=None,
         description="Explanation of usage differences"
     )
 
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
-        populate_by_name = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class DataCompletenessSchema(BaseModel):
@@ -178,17 +201,14 @@ class DataCompletenessSchema(BaseModel):
         le=100
     )
 
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class WordResponse(BaseModel):
     """Complete word information response."""
 
-    word: str = Field(
-        description="The queried word (normalized to lowercase)",
-        alias="word_text"
+    word_text: str = Field(
+        description="The queried word (normalized to lowercase)"
     )
     language: str = Field(
         description="Language code (ISO 639-1)"
@@ -216,10 +236,149 @@ class WordResponse(BaseModel):
         description="Data completeness information"
     )
 
-    class Config:
-        """Pydantic config."""
-        from_attributes = True
-        populate_by_name = True
+    @model_validator(mode="before")
+    @classmethod
+    def normalize_empty_sections(cls, data: Any, info: ValidationInfo) -> Any:
+        """
+        Treat empty optional sections as absent and default data completeness.
+
+        Related words are dropped when the validation context has
+        include_related set to False.
+        """
+        if not isinstance(data, dict):
+            return data
+        data = dict(data)
+        if info.context and not info.context.get("include_related", True):
+            data["related_words"] = None
+        for key in ("phonetic", "grammatical_info", "learning_metadata", "related_words"):
+            if not data.get(key):
+                data[key] = None
+        data.setdefault("data_completeness", {
+            "missing_fields": [],
+            "completeness_percentage": 100
+        })
+        return data
+
+    @classmethod
+    def from_word_data(
+        cls,
+        word_data: Dict[str, Any],
+        include_examples: bool = True,
+        include_related: bool = True
+    ) -> "WordResponse":
+        """
+        Build a response from WordService word data without re-validating it.
+
+        Only for data read from stored rows (WordRepository.get_word_data), which
+        was validated on write; other input should go through model_validate.
+        Constructs the nested schemas bottom-up with model_construct, applying
+        the same shape rules as the validators above.
+
+        Args:
+            word_data: Word data dictionary from the database path
+            include_examples: Whether to include usage examples
+            include_related: Whether to include related words
+
+        Returns:
+            WordResponse model
+        """
+        phonetic = None
+        if word_data.get("phonetic"):
+            phon = word_data["phonetic"]
+            phonetic = PhoneticSchema.model_construct(
+                ipa_transcription=phon["ipa_transcription"],
+                audio_url=phon.get("audio_url")
+            )
+
+        definitions = []
+        for def_data in word_data.get("definitions", []):
+            examples = []
+            if include_examples:
+                for ex in def_data.get("examples", []):
+                    if isinstance(ex, str):
+                        examples.append(UsageExampleSchema.model_construct(
+                            example_text=ex,
+                            context_type="casual"
+                        ))
+                    elif isinstance(ex, dict):
+                        examples.append(UsageExampleSchema.model_construct(
+                            example_text=ex.get("example_text", ""),
+                            context_type=ex.get("context_type")
+                        ))
+            definitions.append(DefinitionSchema.model_construct(
+                part_of_speech=def_data["part_of_speech"],
+                definition_text=def_data["definition_text"],
+                usage_context=def_data.get("usage_context"),
+                examples=examples
+            ))
+
+        grammatical_info = None
+        if word_data.get("grammatical_info"):
+            gram = word_data["grammatical_info"]
+            verb_forms = None
+            if any(gram.get(key) for key in _VERB_FORM_KEYS):
+                verb_forms = VerbFormsSchema.model_construct(
+                    verb_base=gram.get("verb_base"),
+                    verb_past_simple=gram.get("verb_past_simple"),
+                    verb_past_participle=gram.get("verb_past_participle"),
+                    verb_present_participle=gram.get("verb_present_participle"),
+                    verb_third_person=gram.get("verb_third_person")
+                )
+            adjective_forms = None
+            if any(gram.get(key) for key in _ADJECTIVE_FORM_KEYS):
+                adjective_forms = AdjectiveFormsSchema.model_construct(
+                    adj_comparative=gram.get("adj_comparative"),
+                    adj_superlative=gram.get("adj_superlative")
+                )
+            grammatical_info = GrammaticalInfoSchema.model_construct(
+                part_of_speech=gram.get("part_of_speech"),
+                plural_form=gram.get("plural_form"),
+                verb_forms=verb_forms,
+                adjective_forms=adjective_forms
+            )
+
+        learning_metadata = None
+        if word_data.get("learning_metadata"):
+            meta = word_data["learning_metadata"]
+            learning_metadata = LearningMetadataSchema.model_construct(
+                difficulty_level=meta.get("difficulty_level"),
+                cefr_level=meta.get("cefr_level"),
+                frequency_rank=meta.get("frequency_rank"),
+                frequency_band=meta.get("frequency_band"),
+                style_tags=meta.get("style_tags") or []
+            )
+
+        related_words = None
+        if include_related and word_data.get("related_words"):
+            related_words = [
+                RelatedWordSchema.model_construct(
+                    word=rel["word"],
+                    relationship_type=rel["relationship_type"],
+                    usage_notes=rel.get("usage_notes")
+                )
+                for rel in word_data["related_words"]
+            ]
+
+        completeness = word_data.get("data_completeness") or {
+            "missing_fields": [],
+            "completeness_percentage": 100
+        }
+
+        return cls.model_construct(
+            word_text=word_data["word_text"],
+            language=word_data["language"],
+            phonetic=phonetic,
+            definitions=definitions,
+            grammatical_info=grammatical_info,
+            learning_metadata=learning_metadata,
+            related_words=related_words,
+            data_completeness=DataCompletenessSchema.model_construct(
+                missing_fields=completeness["missing_fields"],
+                completeness_percentage=completeness["completeness_percentage"]
+            )
+        )
+
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ErrorResponse(BaseModel):
@@ -236,18 +395,16 @@ class ErrorResponse(BaseModel):
         description="Additional error details"
     )
 
-    class Config:
-        """Pydantic config."""
-        json_schema_extra = {
-            "example": {
-                "error_code": "INVALID_WORD_FORMAT",
-                "message": "Word must contain only letters and hyphens",
-                "details": {
-                    "field": "word",
-                    "pattern": "^[a-zA-Z]+(-[a-zA-Z]+)*$"
-                }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "error_code": "INVALID_WORD_FORMAT",
+            "message": "Word must contain only letters and hyphens",
+            "details": {
+                "field": "word",
+                "pattern": "^[a-zA-Z]+(-[a-zA-Z]+)*$"
             }
         }
+    })
 
 
 class WordNotFoundResponse(ErrorResponse):
@@ -258,15 +415,13 @@ class WordNotFoundResponse(ErrorResponse):
         description="Spelling suggestions for misspelled words"
     )
 
-    class Config:
-        """Pydantic config."""
-        json_schema_extra = {
-            "example": {
-                "error_code": "WORD_NOT_FOUND",
-                "message": "The word 'xyz' was not found in our database",
-                "suggestions": [
-                    "Did you mean: 'yes'?",
-                    "Did you mean: 'zoo'?"
-                ]
-            }
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "error_code": "WORD_NOT_FOUND",
+            "message": "The word 'xyz' was not found in our database",
+            "suggestions": [
+                "Did you mean: 'yes'?",
+                "Did you mean: 'zoo'?"
+            ]
         }
+    })
@@ -0,0 +1,24 @@
+"""Response classes for API endpoints."""
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+from starlette.responses import JSONResponse
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSON response rendered with pydantic-core's serializer.
+
+    Accepts plain JSON-compatible content like JSONResponse, and also pydantic
+    models, which are serialized directly (by alias) without a model_dump() /
+    jsonable_encoder() pass or a re-validation against the response model.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes."""
+        if isinstance(content, BaseModel):
+            # Use the model's own compiled serializer (built once at class
+            # creation) rather than inferring the type on every call
+            return content.__pydantic_serializer__.to_json(content, by_alias=True)
+        return to_json(content, by_alias=True)
@@ -2,6 +2,7 @@
 from typing import Optional, Any
 import json
 
+from pydantic_core import to_json
 from redis.asyncio import Redis, ConnectionPool
 from loguru import logger
 
@@ -100,12 +101,27 @@ class CacheService:
         Returns:
             Cached word data or None if not found
         """
+        cached = await self.get_cached_word_json(word)
+        if cached is None:
+            return None
+        return json.loads(cached)
+
+    async def get_cached_word_json(self, word: str) -> Optional[str]:
+        """
+        Get cached word data as the raw JSON string, without decoding it.
+
+        Args:
+            word: Word text (normalized)
+
+        Returns:
+            Cached JSON document or None if not found
+        """
         key = build_cache_key("word", word)
         try:
             cached = await self.redis.get(key)
             if cached:
                 logger.debug(f"Cache HIT for word: {word}")
-                return json.loads(cached)
+                return cached
             logger.debug(f"Cache MISS for word: {word}")
             return None
         except Exception as e:
@@ -130,17 +146,12 @@ class CacheService:
             True if successfully cached
         """
         key = build_cache_key("word", word)
-
-        # Determine TTL based on word frequency
-        if frequency_rank and frequency_rank <= 5000:
-            # Common words: no expiration
-            ttl = settings.cache_ttl_common_words
-        else:
-            # Less common words: 30-day TTL
-            ttl = settings.cache_ttl_less_common
+        ttl = self._get_word_ttl(frequency_rank)
 
         try:
-            serialized = json.dumps(data)
+            # pydantic-core's encoder is several times faster than json.dumps
+            # and returns UTF-8 bytes that go to Redis as is
+            serialized = to_json(data)
             if ttl > 0:
                 await self.redis.setex(key, ttl, serialized)
             else:
@@ -151,6 +162,70 @@ class CacheService:
             logger.error(f"Redis set error for {word}: {e}")
             return False
 
+    async def get_cached_response(self, word: str) -> Optional[str]:
+        """
+        Get the cached, fully rendered response body for a word.
+
+        Args:
+            word: Word text (normalized)
+
+        Returns:
+            Cached response body (JSON) or None if not found
+        """
+        key = build_cache_key("response", word)
+        try:
+            return await self.redis.get(key)
+        except Exception as e:
+            logger.error(f"Redis get error for response {word}: {e}")
+            return None
+
+    async def set_cached_response(
+        self,
+        word: str,
+        body: bytes,
+        frequency_rank: Optional[int] = None
+    ) -> bool:
+        """
+        Cache a rendered response body, with the same TTL as the word data.
+
+        Args:
+            word: Word text (normalized)
+            body: Rendered JSON response body
+            frequency_rank: Word frequency rank (for TTL determination)
+
+        Returns:
+            True if successfully cached
+        """
+        key = build_cache_key("response", word)
+        ttl = self._get_word_ttl(frequency_rank)
+
+        try:
+            if ttl > 0:
+                await self.redis.setex(key, ttl, body)
+            else:
+                await self.redis.set(key, body)
+            return True
+        except Exception as e:
+            logger.error(f"Redis set error for response {word}: {e}")
+            return False
+
+    @staticmethod
+    def _get_word_ttl(frequency_rank: Optional[int]) -> int:
+        """
+        Get the cache TTL for a word based on its frequency.
+
+        Args:
+            frequency_rank: Word frequency rank
+
+        Returns:
+            TTL in seconds (0 means no expiration)
+        """
+        if frequency_rank and frequency_rank <= 5000:
+            # Common words: no expiration
+            return settings.cache_ttl_common_words
+        # Less common words: 30-day TTL
+        return settings.cache_ttl_less_common
+
     async def set_failed_lookup(self, word: str) -> bool:
         """
         Cache failed lookup to prevent repeated API calls.
@@ -203,7 +278,7 @@ class CacheService:
         """
         key = build_cache_key("word", word)
         try:
-            deleted = await self.redis.delete(key)
+            deleted = await self.redis.delete(key, build_cache_key("response", word))
             logger.info(f"Invalidated cache for word: {word}")
             return deleted > 0
         except Exception as e:
@@ -1,4 +1,5 @@
 """Core configuration using Pydantic BaseSettings."""
+from functools import lru_cache
 from typing import List
 
 from pydantic import Field
@@ -42,6 +43,9 @@ class Settings(BaseSettings):
     enable_wordnet: bool = Field(default=True, description="Enable WordNet adapter")
     enable_cmu_dict: bool = Field(default=True, description="Enable CMU dictionary adapter")
     enable_cefr_levels: bool = Field(default=True, description="Enable CEFR level adapter")
+    enrichment_timeout_seconds: float = Field(
+        default=90.0, description="Upper bound on fetching all adapter data for one word"
+    )
 
     # Rate Limiting
     rate_limit_anon_hourly: int = Field(default=100, description="Anonymous hourly rate limit")
@@ -85,5 +89,16 @@ class Settings(BaseSettings):
     cors_allow_headers: List[str] = Field(default_factory=lambda: ["*"], description="CORS allowed headers")
 
 
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the application settings, reading the environment and .env file once.
+
+    Returns:
+        Shared Settings instance
+    """
+    return Settings()
+
+
 # Global settings instance
-settings = Settings()
+settings = get_settings()
@@ -1,5 +1,6 @@
 """FastAPI application entry point."""
-from contextlib import asynccontextmanager
+import asyncio
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI
 from loguru import logger
@@ -11,9 +12,11 @@ from src.core.cache import init_redis, close_redis
 from src.api.middleware.cors import setup_cors
 from src.api.middleware.rate_limit import limiter, rate_limit_exceeded_handler
 from src.api.middleware.error_handlers import register_exception_handlers
-from src.api.middleware.metrics import PrometheusMiddleware, metrics_endpoint
-from src.api.middleware.request_id import RequestIDMiddleware
+from src.api.middleware.metrics import metrics_endpoint, run_metrics_flusher
+from src.api.middleware.observability import ObservabilityMiddleware
+from src.api.v1.responses import PydanticJSONResponse
 from src.api.v1.endpoints.health import router as health_router
+from src.services.cmu_phonetic_adapter import preload_cmu_dictionary
 
 
 @asynccontextmanager
@@ -24,11 +27,16 @@ async def lifespan(app: FastAPI):
     Handles startup and shutdown events:
     - Initialize database connection pool
     - Initialize Redis connection
+    - Start the background metrics flusher
+    - Preload the CMU dictionary in a worker thread
     - Close connections on shutdown
     """
     # Startup
     logger.info("Starting Grimoire API...")
 
+    metrics_flusher = None
+    cmu_preload = None
+
     try:
         # Initialize database
         await init_db()
@@ -38,6 +46,12 @@ async def lifespan(app: FastAPI):
         await init_redis()
         logger.info("Redis initialized")
 
+        # Apply buffered latency observations in the background
+        metrics_flusher = asyncio.create_task(run_metrics_flusher())
+
+        # Parse the CMU dictionary off the event loop so the first lookup is warm
+        cmu_preload = asyncio.create_task(asyncio.to_thread(preload_cmu_dictionary))
+
         logger.info(f"Grimoire API started successfully on {settings.api_host}:{settings.api_port}")
 
         yield
@@ -46,6 +60,16 @@ async def lifespan(app: FastAPI):
         # Shutdown
         logger.info("Shutting down Grimoire API...")
 
+        # Stop the metrics flusher (it applies any remaining observations)
+        if metrics_flusher is not None:
+            metrics_flusher.cancel()
+            with suppress(asyncio.CancelledError):
+                await metrics_flusher
+
+        # Stop waiting on the CMU preload (the worker thread finishes on its own)
+        if cmu_preload is not None:
+            cmu_preload.cancel()
+
         # Close database connections
         await close_db()
         logger.info("Database connections closed")
@@ -65,6 +89,7 @@ app = FastAPI(
                 "synonyms/antonyms, difficulty levels (CEFR), and frequency data.",
     version=settings.api_version,
     lifespan=lifespan,
+    default_response_class=PydanticJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -73,11 +98,8 @@ app = FastAPI(
 # Setup CORS middleware
 setup_cors(app)
 
-# Setup request ID middleware (should be early in the chain)
-app.add_middleware(RequestIDMiddleware)
-
-# Setup Prometheus metrics middleware
-app.add_middleware(PrometheusMiddleware)
+# Setup request ID tracing and Prometheus metrics (outermost, so it sees every request)
+app.add_middleware(ObservabilityMiddleware)
 
 # Setup rate limiting
 app.state.limiter = limiter
@@ -1,13 +1,31 @@
 """SQLAlchemy models and base configuration."""
+import os
+import time
 from datetime import datetime
 from typing import Any
-from uuid import uuid4
+from uuid import UUID as PyUUID
 
 from sqlalchemy import DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
+def uuid7() -> PyUUID:
+    """
+    Generate a time-ordered UUID version 7 (RFC 9562).
+
+    The leading 48 bits are the Unix timestamp in milliseconds, so new primary
+    keys land at the right edge of the B-tree index instead of at random pages.
+
+    Returns:
+        UUID with a millisecond timestamp prefix and 74 random bits
+    """
+    b = bytearray((time.time_ns() // 1_000_000).to_bytes(6, "big") + os.urandom(10))
+    b[6] = (b[6] & 0x0F) | 0x70  # Version 7
+    b[8] = (b[8] & 0x3F) | 0x80  # RFC 4122 variant
+    return PyUUID(bytes=bytes(b))
+
+
 class Base(DeclarativeBase):
     """Base class for all SQLAlchemy models."""
 
@@ -18,7 +36,7 @@ class Base(DeclarativeBase):
     id: Mapped[UUID] = mapped_column(
         UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
         nullable=False,
     )
 
@@ -87,7 +87,12 @@ class Definition(Base):
             name="check_definition_text_length"
         ),
         Index("idx_definitions_word_id", "word_id"),
-        Index("idx_definitions_word_order", "word_id", "order_index"),
+        Index(
+            "idx_definitions_word_order_covering",
+            "word_id",
+            "order_index",
+            postgresql_include=["part_of_speech", "definition_text"],
+        ),
     )
 
     def __repr__(self) -> str:
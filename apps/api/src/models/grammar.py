@@ -2,7 +2,7 @@
 from typing import Any, Dict, Optional
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy import ForeignKey, String
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -116,10 +116,5 @@ class GrammaticalInformation(Base):
         back_populates="grammatical_info"
     )
 
-    # Table constraints
-    __table_args__ = (
-        Index("idx_grammatical_word_id", "word_id", unique=True),
-    )
-
     def __repr__(self) -> str:
         return f"<GrammaticalInformation(id={self.id}, word_id={self.word_id}, part_of_speech='{self.part_of_speech}')>"
@@ -1,13 +1,70 @@
 """LearningMetadata model - Learning-specific metadata for EFL students."""
-from typing import List, Optional
+from typing import Iterable, List, Optional
 from uuid import UUID
 
-from sqlalchemy import ARRAY, CheckConstraint, ForeignKey, Index, Integer, String
+from loguru import logger
+from sqlalchemy import CheckConstraint, ForeignKey, Index, Integer, SmallInteger
+from sqlalchemy.dialects.postgresql import ENUM
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models import Base
 
 
+# Native PostgreSQL enum types; the types themselves are created by migration
+CEFR_LEVEL_ENUM = ENUM(
+    'A1', 'A2', 'B1', 'B2', 'C1', 'C2',
+    name='cefr_level_t',
+    create_type=False
+)
+
+FREQUENCY_BAND_ENUM = ENUM(
+    'top-100', 'top-1000', 'top-5000', 'top-10000', 'rare', 'very-rare',
+    name='frequency_band_t',
+    create_type=False
+)
+
+# Closed style tag vocabulary. Each tag is one bit of style_tag_mask, so the
+# order here is part of the stored format: only ever append new tags.
+STYLE_TAGS = (
+    'formal', 'informal', 'technical', 'archaic',
+    'slang', 'literary', 'regional', 'offensive',
+)
+STYLE_TAG_BITS = {tag: 1 << bit for bit, tag in enumerate(STYLE_TAGS)}
+
+
+def encode_style_tags(tags: Optional[Iterable[str]]) -> int:
+    """
+    Encode style tags as a bitmask.
+
+    Args:
+        tags: Style tags; tags outside STYLE_TAGS are dropped with a warning
+
+    Returns:
+        Bitmask with one bit set per known tag
+    """
+    mask = 0
+    for tag in tags or ():
+        bit = STYLE_TAG_BITS.get(tag)
+        if bit is None:
+            logger.warning(f"Dropping style tag outside STYLE_TAGS: {tag!r}")
+            continue
+        mask |= bit
+    return mask
+
+
+def decode_style_tags(mask: int) -> List[str]:
+    """
+    Decode a style tag bitmask.
+
+    Args:
+        mask: Bitmask produced by encode_style_tags
+
+    Returns:
+        Style tags, in STYLE_TAGS order
+    """
+    return [tag for tag, bit in STYLE_TAG_BITS.items() if mask & bit]
+
+
 class LearningMetadata(Base):
     """
     Learning-specific metadata for EFL students.
@@ -18,7 +75,8 @@ class LearningMetadata(Base):
         cefr_level: Specific CEFR level (same as difficulty_level, for clarity)
         frequency_rank: Word rank by frequency (1 = most common)
         frequency_band: Band label (e.g., "top-1000", "top-5000", "rare")
-        style_tags: Array of style tags (e.g., ["formal", "technical"])
+        style_tag_mask: Bitmask of style tags (see STYLE_TAGS)
+        style_tags: Style tags decoded from style_tag_mask (e.g., ["formal", "technical"])
 
     Relationships:
         word: Parent word (1:1)
@@ -41,14 +99,14 @@ class LearningMetadata(Base):
 
     # Fields
     difficulty_level: Mapped[Optional[str]] = mapped_column(
-        String(10),
+        CEFR_LEVEL_ENUM,
         nullable=True,
         index=True,
         doc="CEFR level (A1, A2, B1, B2, C1, C2)"
     )
 
     cefr_level: Mapped[Optional[str]] = mapped_column(
-        String(5),
+        CEFR_LEVEL_ENUM,
         nullable=True,
         doc="Specific CEFR level (same as difficulty_level, for clarity)"
     )
@@ -61,15 +119,17 @@ class LearningMetadata(Base):
     )
 
     frequency_band: Mapped[Optional[str]] = mapped_column(
-        String(20),
+        FREQUENCY_BAND_ENUM,
         nullable=True,
         doc="Band label (e.g., 'top-1000', 'top-5000', 'rare')"
     )
 
-    style_tags: Mapped[Optional[List[str]]] = mapped_column(
-        ARRAY(String),
-        nullable=True,
-        doc="Array of style tags (e.g., ['formal', 'technical'])"
+    style_tag_mask: Mapped[int] = mapped_column(
+        SmallInteger,
+        nullable=False,
+        default=0,
+        server_default="0",
+        doc="Bitmask of style tags (see STYLE_TAGS)"
     )
 
     # Relationships
@@ -84,22 +144,18 @@ class LearningMetadata(Base):
             "frequency_rank IS NULL OR frequency_rank > 0",
             name="check_frequency_rank_positive"
         ),
-        CheckConstraint(
-            "cefr_level IN ('A1', 'A2', 'B1', 'B2', 'C1', 'C2') OR cefr_level IS NULL",
-            name="check_cefr_level"
-        ),
-        CheckConstraint(
-            "difficulty_level IN ('A1', 'A2', 'B1', 'B2', 'C1', 'C2') OR difficulty_level IS NULL",
-            name="check_difficulty_level"
-        ),
-        CheckConstraint(
-            "frequency_band IN ('top-100', 'top-1000', 'top-5000', 'top-10000', 'rare', 'very-rare') OR frequency_band IS NULL",
-            name="check_frequency_band"
-        ),
-        Index("idx_learning_metadata_word_id", "word_id", unique=True),
         Index("idx_learning_metadata_frequency_rank", "frequency_rank"),
         Index("idx_learning_metadata_difficulty_level", "difficulty_level"),
     )
 
+    @property
+    def style_tags(self) -> List[str]:
+        """Style tags (e.g., ['formal', 'technical'])."""
+        return decode_style_tags(self.style_tag_mask or 0)
+
+    @style_tags.setter
+    def style_tags(self, tags: Optional[Iterable[str]]) -> None:
+        self.style_tag_mask = encode_style_tags(tags)
+
     def __repr__(self) -> str:
         return f"<LearningMetadata(id={self.id}, word_id={self.word_id}, cefr_level='{self.cefr_level}', frequency_rank={self.frequency_rank})>"
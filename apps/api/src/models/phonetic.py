@@ -2,7 +2,7 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import ForeignKey, Index, String
+from sqlalchemy import ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models import Base
@@ -50,10 +50,5 @@ class PhoneticRepresentation(Base):
         back_populates="phonetic"
     )
 
-    # Table constraints
-    __table_args__ = (
-        Index("idx_phonetic_word_id", "word_id", unique=True),
-    )
-
     def __repr__(self) -> str:
         return f"<PhoneticRepresentation(id={self.id}, word_id={self.word_id}, ipa='{self.ipa_transcription}')>"
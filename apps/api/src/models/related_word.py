@@ -103,7 +103,12 @@ class RelatedWord(Base):
         ),
         Index("idx_related_words_source", "source_word_id"),
         Index("idx_related_words_target", "target_word_id"),
-        Index("idx_related_words_source_type", "source_word_id", "relationship_type"),
+        Index(
+            "idx_related_words_source_type_covering",
+            "source_word_id",
+            "relationship_type",
+            postgresql_include=["target_word_id", "strength"],
+        ),
         Index("idx_related_words_unique", "source_word_id", "target_word_id", "relationship_type", unique=True),
     )
 
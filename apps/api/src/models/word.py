@@ -1,4 +1,5 @@
 """Word model - Primary entity representing an English word."""
+import re
 from datetime import datetime
 from typing import List, Optional
 
@@ -9,6 +10,10 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from src.models import Base
 
 
+# Python-side equivalent of check_word_text_pattern (use with fullmatch)
+WORD_TEXT_PATTERN = re.compile(r'[a-z]+(?:-[a-z]+)*')
+
+
 class Word(Base):
     """
     Primary entity representing an English word.
@@ -33,8 +38,6 @@ class Word(Base):
     word_text: Mapped[str] = mapped_column(
         String(100),
         nullable=False,
-        unique=True,
-        index=True,
         doc="The word itself (lowercase, normalized)"
     )
 
@@ -96,10 +99,22 @@ class Word(Base):
 
     # Table constraints
     __table_args__ = (
+        # Equivalent to word_text ~ '^[a-z]+(-[a-z]+)*$', without the regex engine
         CheckConstraint(
-            "word_text ~ '^[a-z]+(-[a-z]+)*$'",
+            "word_text <> '' "
+            "AND translate(word_text, 'abcdefghijklmnopqrstuvwxyz-', '') = '' "
+            "AND left(word_text, 1) <> '-' "
+            "AND right(word_text, 1) <> '-' "
+            "AND strpos(word_text, '--') = 0",
             name="check_word_text_pattern"
         ),
+        # Unique, and covers the columns the word lookup reads (index-only scan)
+        Index(
+            "uq_words_word_text_covering",
+            "word_text",
+            unique=True,
+            postgresql_include=["id", "language"]
+        ),
         Index("idx_words_language", "language"),
         Index("idx_words_created_at", "created_at"),
     )
@@ -2,20 +2,103 @@
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 from loguru import logger
 
-from src.models.word import Word
+from src.models import uuid7
+from src.models.word import WORD_TEXT_PATTERN, Word
 from src.models.definition import Definition
 from src.models.usage_example import UsageExample
 from src.models.phonetic import PhoneticRepresentation
 from src.models.grammar import GrammaticalInformation
-from src.models.learning_metadata import LearningMetadata
+from src.models.learning_metadata import STYLE_TAGS, LearningMetadata, encode_style_tags
 from src.models.related_word import RelatedWord
 
 
+# Style tag vocabulary as a SQL array; bit N of style_tag_mask is element N + 1
+_STYLE_TAGS_SQL = "ARRAY[" + ", ".join(f"'{tag}'" for tag in STYLE_TAGS) + "]"
+
+# Builds a word's full API document in one statement, so a lookup needs no
+# ORM objects at all (see WordRepository.get_word_data for the shape)
+WORD_DATA_QUERY = text(f"""
+SELECT json_build_object(
+    'word_text', w.word_text,
+    'language', w.language,
+    'phonetic', (
+        SELECT json_build_object(
+            'ipa_transcription', p.ipa_transcription,
+            'audio_url', p.audio_url
+        )
+        FROM phonetic_representations p
+        WHERE p.word_id = w.id
+    ),
+    'definitions', COALESCE((
+        SELECT json_agg(json_build_object(
+            'definition_text', d.definition_text,
+            'part_of_speech', d.part_of_speech,
+            'usage_context', d.usage_context,
+            'examples', COALESCE((
+                SELECT json_agg(json_build_object(
+                    'example_text', e.example_text,
+                    'context_type', e.context_type
+                ) ORDER BY e.order_index)
+                FROM usage_examples e
+                WHERE e.definition_id = d.id
+            ), '[]'::json),
+            'order_index', d.order_index
+        ) ORDER BY d.order_index)
+        FROM definitions d
+        WHERE d.word_id = w.id
+    ), '[]'::json),
+    'grammatical_info', (
+        SELECT json_build_object(
+            'part_of_speech', g.part_of_speech,
+            'plural_form', g.plural_form,
+            'verb_base', g.verb_base,
+            'verb_past_simple', g.verb_past_simple,
+            'verb_past_participle', g.verb_past_participle,
+            'verb_present_participle', g.verb_present_participle,
+            'verb_third_person', g.verb_third_person,
+            'adj_comparative', g.adj_comparative,
+            'adj_superlative', g.adj_superlative,
+            'irregular_forms_json', g.irregular_forms_json
+        )
+        FROM grammatical_information g
+        WHERE g.word_id = w.id
+    ),
+    'learning_metadata', (
+        SELECT json_build_object(
+            'difficulty_level', m.difficulty_level,
+            'cefr_level', m.cefr_level,
+            'frequency_rank', m.frequency_rank,
+            'frequency_band', m.frequency_band,
+            'style_tags', (
+                SELECT COALESCE(json_agg(t.tag ORDER BY t.bit), '[]'::json)
+                FROM unnest({_STYLE_TAGS_SQL}) WITH ORDINALITY AS t(tag, bit)
+                WHERE m.style_tag_mask & (1 << (t.bit::int - 1)) <> 0
+            )
+        )
+        FROM learning_metadata m
+        WHERE m.word_id = w.id
+    ),
+    'related_words', COALESCE((
+        SELECT json_agg(json_build_object(
+            'word', t.word_text,
+            'relationship_type', r.relationship_type,
+            'usage_notes', r.usage_notes
+        ))
+        FROM related_words r
+        JOIN words t ON t.id = r.target_word_id
+        WHERE r.source_word_id = w.id
+    ), '[]'::json)
+)
+FROM words w
+WHERE w.word_text = :word_text
+""")
+
+
 class WordRepository:
     """Repository for accessing and managing Word entities."""
 
@@ -43,21 +126,32 @@ class WordRepository:
         Returns:
             Word instance or None if not found
         """
+        word_text = word_text.lower()
+
+        # No stored word can fail the table's CHECK constraint, so skip the query
+        if not WORD_TEXT_PATTERN.fullmatch(word_text):
+            logger.debug(f"Word not found in database: {word_text}")
+            return None
+
         try:
-            query = select(Word).where(Word.word_text == word_text.lower())
+            query = select(Word).where(Word.word_text == word_text)
 
             if eager_load:
-                # Eager load all relationships to avoid N+1 queries
+                # Eager load all relationships to avoid N+1 queries. The one-to-one
+                # rows and the small definitions -> examples chain are joined into
+                # the main query; related words (wider fan-out) are fetched with
+                # their targets in one follow-up query. Two round trips in total.
                 query = query.options(
-                    selectinload(Word.definitions).selectinload(Definition.usage_examples),
-                    selectinload(Word.phonetic),
-                    selectinload(Word.grammatical_info),
-                    selectinload(Word.learning_metadata),
-                    selectinload(Word.related_words_source).selectinload(RelatedWord.target_word),
+                    joinedload(Word.definitions).joinedload(Definition.usage_examples),
+                    joinedload(Word.phonetic),
+                    joinedload(Word.grammatical_info),
+                    joinedload(Word.learning_metadata),
+                    selectinload(Word.related_words_source).joinedload(RelatedWord.target_word),
                 )
 
             result = await self.db.execute(query)
-            word = result.scalar_one_or_none()
+            # unique() collapses the duplicate parent rows produced by the joins
+            word = result.unique().scalar_one_or_none()
 
             if word:
                 logger.debug(f"Found word in database: {word_text}")
@@ -70,6 +164,60 @@ class WordRepository:
             logger.error(f"Error fetching word '{word_text}': {e}")
             raise
 
+    async def get_word_data(self, word_text: str) -> Optional[dict]:
+        """
+        Get a word and all its relations as a JSON document built by PostgreSQL.
+
+        Built by a single query, skipping ORM hydration. The document has, in
+        order:
+
+        - word_text, language
+        - phonetic: {ipa_transcription, audio_url}, or None without a row
+        - definitions: [{definition_text, part_of_speech, usage_context,
+          examples: [{example_text, context_type}], order_index}], with
+          definitions and examples sorted by order_index, [] when empty
+        - grammatical_info: {part_of_speech, plural_form, verb_base,
+          verb_past_simple, verb_past_participle, verb_present_participle,
+          verb_third_person, adj_comparative, adj_superlative,
+          irregular_forms_json}, or None without a row
+        - learning_metadata: {difficulty_level, cefr_level, frequency_rank,
+          frequency_band, style_tags}, or None without a row; style_tags is
+          [] when no tags are set
+        - related_words: [{word, relationship_type, usage_notes}], [] when empty
+
+        data_completeness is not included; WordService adds it.
+
+        Args:
+            word_text: Word text to search for (normalized)
+
+        Returns:
+            Word data dictionary or None if not found
+        """
+        word_text = word_text.lower()
+
+        # No stored word can fail the table's CHECK constraint, so skip the query
+        if not WORD_TEXT_PATTERN.fullmatch(word_text):
+            logger.debug(f"Word not found in database: {word_text}")
+            return None
+
+        try:
+            result = await self.db.execute(
+                WORD_DATA_QUERY,
+                {"word_text": word_text}
+            )
+            word_data = result.scalar_one_or_none()
+
+            if word_data is not None:
+                logger.debug(f"Found word in database: {word_text}")
+            else:
+                logger.debug(f"Word not found in database: {word_text}")
+
+            return word_data
+
+        except Exception as e:
+            logger.error(f"Error fetching word '{word_text}': {e}")
+            raise
+
     async def get_by_id(self, word_id: UUID) -> Optional[Word]:
         """
         Get word by ID.
@@ -111,41 +259,40 @@ class WordRepository:
             related_words_data: List of dicts with related word fields
 
         Returns:
-            Created Word instance with all relationships
+            Created Word instance (relationships are not loaded)
 
         Raises:
             Exception: If creation fails
         """
         try:
-            # Create word entity
             word = Word(
+                id=uuid7(),
                 word_text=word_text.lower(),
                 language=language
             )
             self.db.add(word)
-            await self.db.flush()  # Get word ID for foreign keys
+            await self.db.flush()
 
-            # Create phonetic representation (1:1)
-            if phonetic_data:
-                phonetic = PhoneticRepresentation(
-                    word_id=word.id,
-                    ipa_transcription=phonetic_data.get("ipa_transcription", ""),
-                    audio_url=phonetic_data.get("audio_url")
-                )
-                self.db.add(phonetic)
+            # The child rows are written with Core bulk INSERTs rather than as ORM
+            # objects: one statement per table however many definitions and
+            # examples there are, and no per-row identity map bookkeeping.
+            # Primary keys are generated client-side (uuid7), so examples can be
+            # linked to their definitions without a RETURNING round trip.
+            definition_rows: list[dict] = []
+            example_rows: list[dict] = []
 
             # Create definitions (1:many)
             if definitions_data:
                 for idx, def_data in enumerate(definitions_data, start=1):
-                    definition = Definition(
-                        word_id=word.id,
-                        definition_text=def_data["definition_text"],
-                        part_of_speech=def_data["part_of_speech"],
-                        usage_context=def_data.get("usage_context"),
-                        order_index=def_data.get("order_index", idx)
-                    )
-                    self.db.add(definition)
-                    await self.db.flush()  # Get definition ID for usage examples
+                    definition_id = uuid7()
+                    definition_rows.append({
+                        "id": definition_id,
+                        "word_id": word.id,
+                        "definition_text": def_data["definition_text"],
+                        "part_of_speech": def_data["part_of_speech"],
+                        "usage_context": def_data.get("usage_context"),
+                        "order_index": def_data.get("order_index", idx)
+                    })
 
                     # Create usage examples for this definition
                     examples = def_data.get("examples", [])
@@ -161,48 +308,70 @@ class WordRepository:
                                 context_type = None
 
                             if example_text:
-                                usage_example = UsageExample(
-                                    definition_id=definition.id,
-                                    example_text=example_text,
-                                    context_type=context_type,
-                                    order_index=ex_idx
-                                )
-                                self.db.add(usage_example)
+                                example_rows.append({
+                                    "id": uuid7(),
+                                    "definition_id": definition_id,
+                                    "example_text": example_text,
+                                    "context_type": context_type,
+                                    "order_index": ex_idx
+                                })
+
+            if definition_rows:
+                await self.db.execute(insert(Definition.__table__), definition_rows)
+            if example_rows:
+                await self.db.execute(insert(UsageExample.__table__), example_rows)
+
+            # Create phonetic representation (1:1)
+            if phonetic_data:
+                await self.db.execute(
+                    insert(PhoneticRepresentation.__table__),
+                    {
+                        "word_id": word.id,
+                        "ipa_transcription": phonetic_data.get("ipa_transcription", ""),
+                        "audio_url": phonetic_data.get("audio_url")
+                    }
+                )
 
             # Create grammatical information (1:1)
             if grammatical_data:
-                grammar = GrammaticalInformation(
-                    word_id=word.id,
-                    **grammatical_data
+                await self.db.execute(
+                    insert(GrammaticalInformation.__table__),
+                    {"word_id": word.id, **grammatical_data}
                 )
-                self.db.add(grammar)
 
             # Create learning metadata (1:1)
             if learning_metadata_data:
-                metadata = LearningMetadata(
-                    word_id=word.id,
-                    **learning_metadata_data
+                metadata_row = {"word_id": word.id, **learning_metadata_data}
+                metadata_row["style_tag_mask"] = encode_style_tags(
+                    metadata_row.pop("style_tags", None)
+                )
+                await self.db.execute(
+                    insert(LearningMetadata.__table__),
+                    metadata_row
                 )
-                self.db.add(metadata)
 
             # Create related words (many:many)
             if related_words_data:
-                for rel_data in related_words_data:
-                    # Note: target_word_id should already exist or be created separately
-                    related = RelatedWord(
-                        source_word_id=word.id,
-                        target_word_id=rel_data["target_word_id"],
-                        relationship_type=rel_data["relationship_type"],
-                        usage_notes=rel_data.get("usage_notes"),
-                        strength=rel_data.get("strength")
-                    )
-                    self.db.add(related)
+                # Note: target_word_id should already exist or be created separately
+                await self.db.execute(
+                    insert(RelatedWord.__table__),
+                    [
+                        {
+                            "source_word_id": word.id,
+                            "target_word_id": rel_data["target_word_id"],
+                            "relationship_type": rel_data["relationship_type"],
+                            "usage_notes": rel_data.get("usage_notes"),
+                            "strength": rel_data.get("strength")
+                        }
+                        for rel_data in related_words_data
+                    ]
+                )
 
-            await self.db.flush()
             logger.info(f"Created word '{word_text}' with all relations")
 
-            # Refresh to load all relationships
-            await self.db.refresh(word)
+            # No refresh needed: the flush already fetched the server-generated
+            # timestamps with RETURNING. Relationships are not loaded; read the
+            # stored word back with get_word_data().
             return word
 
         except Exception as e:
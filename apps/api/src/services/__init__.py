@@ -1,17 +1,27 @@
 """Service layer for business logic."""
+from importlib import import_module
+from typing import Any
 
-from src.services.data_source_adapter import DataSourceAdapter
-from src.services.claude_enrichment_adapter import ClaudeEnrichmentAdapter
-from src.services.wordnet_adapter import WordNetAdapter
-from src.services.cmu_phonetic_adapter import CMUPhoneticAdapter
-from src.services.enrichment_service import EnrichmentService
-from src.services.word_service import WordService
+# Exported names and the modules defining them. They are imported on first
+# access (PEP 562), so importing one service module does not pull in every
+# adapter's SDK (anthropic, nltk, ...) through this package.
+_EXPORTS = {
+    "DataSourceAdapter": "src.services.data_source_adapter",
+    "ClaudeEnrichmentAdapter": "src.services.claude_enrichment_adapter",
+    "WordNetAdapter": "src.services.wordnet_adapter",
+    "CMUPhoneticAdapter": "src.services.cmu_phonetic_adapter",
+    "EnrichmentService": "src.services.enrichment_service",
+    "WordService": "src.services.word_service",
+}
 
-__all__ = [
-    "DataSourceAdapter",
-    "ClaudeEnrichmentAdapter",
-    "WordNetAdapter",
-    "CMUPhoneticAdapter",
-    "EnrichmentService",
-    "WordService",
-]
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported service class on first access."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
@@ -1,11 +1,104 @@
 """CEFR level adapter for word difficulty classification."""
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Sequence
 
 from loguru import logger
 
 from src.services.data_source_adapter import DataSourceAdapter
 
 
+# Simplified CEFR level mapping for common words (~100 example words).
+# In production, load this from a data file (CEFR-J wordlist, 10,000+ words).
+# The lists are already lowercase.
+
+# A1: Beginner (basic everyday words)
+_A1_WORDS = (
+    "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
+    "of", "with", "by", "from", "up", "down", "out", "about", "into",
+    "i", "you", "he", "she", "it", "we", "they", "my", "your", "his",
+    "be", "have", "do", "say", "go", "get", "make", "know", "see", "come",
+    "think", "take", "give", "use", "find", "tell", "ask", "work", "seem",
+    "cat", "dog", "house", "book", "water", "food", "man", "woman", "child",
+    "day", "time", "year", "way", "thing", "place", "work", "life", "hand",
+    "good", "new", "first", "last", "long", "great", "little", "own", "other",
+    "old", "right", "big", "high", "small", "large", "next", "early", "young",
+)
+
+# A2: Elementary (common daily life words)
+_A2_WORDS = (
+    "become", "leave", "feel", "try", "call", "move", "live", "believe",
+    "bring", "happen", "write", "sit", "stand", "lose", "pay", "meet",
+    "family", "friend", "people", "person", "city", "country", "world",
+    "money", "business", "school", "job", "problem", "question", "answer",
+    "important", "different", "possible", "available", "similar", "recent",
+    "happy", "difficult", "easy", "hard", "simple", "common", "special",
+)
+
+# B1: Intermediate (general topics, abstract concepts)
+_B1_WORDS = (
+    "develop", "require", "consider", "continue", "appear", "expect",
+    "suggest", "involve", "increase", "provide", "receive", "produce",
+    "society", "government", "company", "system", "service", "community",
+    "education", "health", "issue", "situation", "experience", "knowledge",
+    "significant", "various", "particular", "specific", "general", "public",
+    "individual", "social", "economic", "political", "environmental",
+)
+
+# B2: Upper Intermediate (complex ideas, nuanced language)
+_B2_WORDS = (
+    "demonstrate", "establish", "determine", "indicate", "analyze",
+    "emphasize", "implement", "achieve", "maintain", "recognize",
+    "concept", "framework", "perspective", "context", "dimension",
+    "phenomenon", "hypothesis", "methodology", "principle", "criterion",
+    "substantial", "comprehensive", "extensive", "adequate", "relevant",
+    "consistent", "significant", "predominant", "prevalent", "inherent",
+)
+
+# C1: Advanced (sophisticated academic/professional language)
+_C1_WORDS = (
+    "ubiquitous", "serendipity", "juxtapose", "paradox", "conundrum",
+    "ephemeral", "ambiguous", "arbitrary", "coherent", "intrinsic",
+    "facilitate", "perpetuate", "undermine", "alleviate", "exacerbate",
+    "phenomenon", "paradigm", "dichotomy", "nuance", "rhetoric",
+    "meticulous", "prodigious", "quintessential", "rudimentary", "exemplary",
+)
+
+# C2: Proficiency (highly specialized, literary, rare words)
+_C2_WORDS = (
+    "photosynthesis", "extemporaneous", "obfuscate", "recalcitrant",
+    "sycophant", "ephemeral", "perspicacious", "pusillanimous",
+    "verisimilitude", "laconic", "insouciant", "magnanimous",
+)
+
+# Word -> CEFR level, built once at import and shared by every adapter. Later
+# levels win for words listed twice (e.g. "significant" is B2).
+_CEFR_LEVELS: Mapping[str, str] = MappingProxyType({
+    word: level
+    for level, words in (
+        ("A1", _A1_WORDS),
+        ("A2", _A2_WORDS),
+        ("B1", _B1_WORDS),
+        ("B2", _B2_WORDS),
+        ("C1", _C1_WORDS),
+        ("C2", _C2_WORDS),
+    )
+    for word in words
+})
+
+# fetch_word_data result for each level, built once and shared (read-only)
+_CEFR_RESULTS: Mapping[str, Mapping[str, str]] = MappingProxyType({
+    level: MappingProxyType({
+        "difficulty_level": level,
+        "cefr_level": level,
+        "source": "cefr_adapter"
+    })
+    for level in ("A1", "A2", "B1", "B2", "C1", "C2")
+})
+
+# Shared, read-only result for words without a CEFR level
+_CEFR_MISS: Mapping[str, str] = MappingProxyType({})
+
+
 class CEFRAdapter(DataSourceAdapter):
     """
     Adapter for CEFR (Common European Framework of Reference) difficulty levels.
@@ -17,111 +110,35 @@ class CEFRAdapter(DataSourceAdapter):
     from Tamagawa University (10,000+ words with research-backed levels).
     """
 
+    # Fields this adapter can provide (see get_supported_fields)
+    supported_fields = ("difficulty_level", "cefr_level")
+
+    # Every accepted field name, aliases included (see supports_field)
+    _SUPPORTED = frozenset({"difficulty_level", "cefr_level", "difficulty", "cefr"})
+
     def __init__(self):
-        """Initialize CEFR adapter with basic word-level mappings."""
-        # Simplified CEFR level mapping for common words
-        # In production, load this from a data file (CEFR-J wordlist)
-        self.cefr_levels = self._load_cefr_mappings()
+        """Initialize CEFR adapter with the shared word-level mappings."""
+        self.cefr_levels = _CEFR_LEVELS
 
-        logger.info("CEFRAdapter initialized with basic word mappings")
+        logger.info(f"CEFRAdapter initialized with {len(self.cefr_levels)} word mappings")
 
-    def _load_cefr_mappings(self) -> Dict[str, str]:
+    async def fetch_word_data(self, word: str) -> Mapping[str, Any]:
         """
-        Load CEFR level mappings for common words.
+        Fetch CEFR difficulty level for a word.
 
-        Returns:
-            Dictionary mapping word -> CEFR level (A1, A2, B1, B2, C1, C2)
+        Async wrapper around fetch_word_data_sync; the lookup does no I/O.
 
-        Note:
-            This is a simplified implementation with ~100 example words.
-            Production should load from CEFR-J wordlist (10,000+ words).
+        Args:
+            word: Word text to look up (normalized to lowercase)
+
+        Returns:
+            Same as fetch_word_data_sync
         """
-        # A1: Beginner (basic everyday words)
-        a1_words = [
-            "the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for",
-            "of", "with", "by", "from", "up", "down", "out", "about", "into",
-            "i", "you", "he", "she", "it", "we", "they", "my", "your", "his",
-            "be", "have", "do", "say", "go", "get", "make", "know", "see", "come",
-            "think", "take", "give", "use", "find", "tell", "ask", "work", "seem",
-            "cat", "dog", "house", "book", "water", "food", "man", "woman", "child",
-            "day", "time", "year", "way", "thing", "place", "work", "life", "hand",
-            "good", "new", "first", "last", "long", "great", "little", "own", "other",
-            "old", "right", "big", "high", "small", "large", "next", "early", "young",
-        ]
-
-        # A2: Elementary (common daily life words)
-        a2_words = [
-            "become", "leave", "feel", "try", "call", "move", "live", "believe",
-            "bring", "happen", "write", "sit", "stand", "lose", "pay", "meet",
-            "family", "friend", "people", "person", "city", "country", "world",
-            "money", "business", "school", "job", "problem", "question", "answer",
-            "important", "different", "possible", "available", "similar", "recent",
-            "happy", "difficult", "easy", "hard", "simple", "common", "special",
-        ]
-
-        # B1: Intermediate (general topics, abstract concepts)
-        b1_words = [
-            "develop", "require", "consider", "continue", "appear", "expect",
-            "suggest", "involve", "increase", "provide", "receive", "produce",
-            "society", "government", "company", "system", "service", "community",
-            "education", "health", "issue", "situation", "experience", "knowledge",
-            "significant", "various", "particular", "specific", "general", "public",
-            "individual", "social", "economic", "political", "environmental",
-        ]
-
-        # B2: Upper Intermediate (complex ideas, nuanced language)
-        b2_words = [
-            "demonstrate", "establish", "determine", "indicate", "analyze",
-            "emphasize", "implement", "achieve", "maintain", "recognize",
-            "concept", "framework", "perspective", "context", "dimension",
-            "phenomenon", "hypothesis", "methodology", "principle", "criterion",
-            "substantial", "comprehensive", "extensive", "adequate", "relevant",
-            "consistent", "significant", "predominant", "prevalent", "inherent",
-        ]
-
-        # C1: Advanced (sophisticated academic/professional language)
-        c1_words = [
-            "ubiquitous", "serendipity", "juxtapose", "paradox", "conundrum",
-            "ephemeral", "ambiguous", "arbitrary", "coherent", "intrinsic",
-            "facilitate", "perpetuate", "undermine", "alleviate", "exacerbate",
-            "phenomenon", "paradigm", "dichotomy", "nuance", "rhetoric",
-            "meticulous", "prodigious", "quintessential", "rudimentary", "exemplary",
-        ]
-
-        # C2: Proficiency (highly specialized, literary, rare words)
-        c2_words = [
-            "photosynthesis", "extemporaneous", "obfuscate", "recalcitrant",
-            "sycophant", "ephemeral", "perspicacious", "pusillanimous",
-            "verisimilitude", "laconic", "insouciant", "magnanimous",
-        ]
-
-        # Build dictionary with all mappings
-        cefr_dict = {}
-
-        for word in a1_words:
-            cefr_dict[word.lower()] = "A1"
-
-        for word in a2_words:
-            cefr_dict[word.lower()] = "A2"
-
-        for word in b1_words:
-            cefr_dict[word.lower()] = "B1"
-
-        for word in b2_words:
-            cefr_dict[word.lower()] = "B2"
-
-        for word in c1_words:
-            cefr_dict[word.lower()] = "C1"
-
-        for word in c2_words:
-            cefr_dict[word.lower()] = "C2"
-
-        logger.debug(f"Loaded {len(cefr_dict)} words with CEFR levels")
-        return cefr_dict
-
-    async def fetch_word_data(self, word: str) -> Dict[str, Any]:
+        return self.fetch_word_data_sync(word)
+
+    def fetch_word_data_sync(self, word: str) -> Mapping[str, Any]:
         """
-        Fetch CEFR difficulty level for a word.
+        Fetch CEFR difficulty level for a word without going through the event loop.
 
         Args:
             word: Word text to look up (normalized to lowercase)
@@ -129,21 +146,35 @@ class CEFRAdapter(DataSourceAdapter):
         Returns:
             Dictionary with difficulty level or empty if not found
             Format: {"difficulty_level": "A1|A2|B1|B2|C1|C2"}
+            All results are shared, read-only mappings.
         """
-        word_lower = word.lower()
-
-        cefr_level = self.cefr_levels.get(word_lower)
+        cefr_level = self._lookup(word.lower())
 
+        # Positional args: loguru only formats the message if DEBUG is enabled
         if cefr_level:
-            logger.debug(f"Found CEFR level for '{word}': {cefr_level}")
-            return {
-                "difficulty_level": cefr_level,
-                "cefr_level": cefr_level,
-                "source": "cefr_adapter"
-            }
+            logger.debug("Found CEFR level for '{}': {}", word, cefr_level)
+            return _CEFR_RESULTS[cefr_level]
         else:
-            logger.debug(f"No CEFR level found for '{word}' (will use Claude estimation)")
-            return {}
+            logger.debug("No CEFR level found for '{}' (will use Claude estimation)", word)
+            return _CEFR_MISS
+
+    async def fetch_many(self, words: Sequence[str]) -> Dict[str, Mapping[str, Any]]:
+        """
+        Fetch CEFR difficulty levels for several words in one call.
+
+        Args:
+            words: Word texts to look up (normalized to lowercase)
+
+        Returns:
+            Dictionary mapping each word to its fetch_word_data result
+            (empty for words without a CEFR level)
+        """
+        lookup = self._lookup
+        results = {}
+        for word in words:
+            cefr_level = lookup(word.lower())
+            results[word] = _CEFR_RESULTS[cefr_level] if cefr_level else _CEFR_MISS
+        return results
 
     def supports_field(self, field: str) -> bool:
         """
@@ -155,26 +186,31 @@ class CEFRAdapter(DataSourceAdapter):
         Returns:
             True if field is supported (difficulty_level, cefr_level)
         """
-        supported_fields = {"difficulty_level", "cefr_level", "difficulty", "cefr"}
-        return field in supported_fields
+        return field in self._SUPPORTED
 
-    def get_supported_fields(self) -> list[str]:
+    def get_level(self, word: str) -> Optional[str]:
         """
-        Get list of all supported fields.
+        Get CEFR level for a word (synchronous convenience method).
+
+        Args:
+            word: Word text to look up
 
         Returns:
-            List of field names this adapter can provide
+            CEFR level string (A1-C2) or None if not found
         """
-        return ["difficulty_level", "cefr_level"]
+        return self._lookup(word.lower())
 
-    def get_level(self, word: str) -> Optional[str]:
+    def _lookup(self, word_lower: str) -> Optional[str]:
         """
-        Get CEFR level for a word (synchronous convenience method).
+        Probe the level table with an already-lowercased word.
+
+        Every public lookup normalizes its input exactly once and then calls
+        this, so no path lowercases the same word twice.
 
         Args:
-            word: Word text to look up
+            word_lower: Lowercased word text
 
         Returns:
             CEFR level string (A1-C2) or None if not found
         """
-        return self.cefr_levels.get(word.lower())
+        return self.cefr_levels.get(word_lower)
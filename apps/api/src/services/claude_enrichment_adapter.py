@@ -21,6 +21,22 @@ class ClaudeEnrichmentAdapter(DataSourceAdapter):
     - Part of speech analysis
     """
 
+    # Fields this adapter can provide (see get_supported_fields)
+    supported_fields = (
+        "definitions",
+        "phonetic",
+        "phonetics",
+        "examples",
+        "grammar",
+        "grammatical_info",
+        "related_words",
+        "synonyms",
+        "antonyms",
+    )
+
+    # Set form of supported_fields for supports_field lookups
+    _SUPPORTED = frozenset(supported_fields)
+
     def __init__(self):
         """Initialize Claude adapter with Anthropic client."""
         self.client = AsyncAnthropic(api_key=settings.anthropic_api_key)
@@ -87,18 +103,7 @@ class ClaudeEnrichmentAdapter(DataSourceAdapter):
         Returns:
             True if field is supported (definitions, phonetics, examples, grammar)
         """
-        supported_fields = {
-            "definitions",
-            "phonetic",
-            "phonetics",
-            "examples",
-            "grammar",
-            "grammatical_info",
-            "related_words",
-            "synonyms",
-            "antonyms",
-        }
-        return field in supported_fields
+        return field in self._SUPPORTED
 
     def _build_enrichment_prompt(self, word: str) -> str:
         """
@@ -207,22 +212,3 @@ IMPORTANT GUIDELINES:
    - Example usage note: "While 'joyful' emphasizes strong emotion, 'happy' is more general"
 
 Return ONLY valid JSON, no additional text or explanation."""
-
-    def get_supported_fields(self) -> list[str]:
-        """
-        Get list of all supported fields.
-
-        Returns:
-            List of field names this adapter can provide
-        """
-        return [
-            "definitions",
-            "phonetic",
-            "phonetics",
-            "examples",
-            "grammar",
-            "grammatical_info",
-            "related_words",
-            "synonyms",
-            "antonyms",
-        ]
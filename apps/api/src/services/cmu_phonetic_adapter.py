@@ -1,12 +1,120 @@
 """CMU Pronouncing Dictionary adapter for phonetic transcriptions."""
-from typing import Any, Dict, Optional
-import nltk
-from nltk.corpus import cmudict
+import threading
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Sequence
 from loguru import logger
 
 from src.services.data_source_adapter import DataSourceAdapter
 
 
+# ARPABET to IPA conversion mapping
+ARPABET_TO_IPA = {
+    'AA': 'ɑ', 'AE': 'æ', 'AH': 'ə', 'AO': 'ɔ', 'AW': 'aʊ',
+    'AY': 'aɪ', 'B': 'b', 'CH': 'tʃ', 'D': 'd', 'DH': 'ð',
+    'EH': 'ɛ', 'ER': 'ɜr', 'EY': 'eɪ', 'F': 'f', 'G': 'ɡ',
+    'HH': 'h', 'IH': 'ɪ', 'IY': 'i', 'JH': 'dʒ', 'K': 'k',
+    'L': 'l', 'M': 'm', 'N': 'n', 'NG': 'ŋ', 'OW': 'oʊ',
+    'OY': 'ɔɪ', 'P': 'p', 'R': 'r', 'S': 's', 'SH': 'ʃ',
+    'T': 't', 'TH': 'θ', 'UH': 'ʊ', 'UW': 'u', 'V': 'v',
+    'W': 'w', 'Y': 'j', 'Z': 'z', 'ZH': 'ʒ'
+}
+
+# Every ARPABET token, with and without a stress digit (0 = none,
+# 1 = primary, 2 = secondary), mapped straight to its IPA output
+ARPABET_STRESSED_TO_IPA = {
+    phone + stress: mark + ipa
+    for phone, ipa in ARPABET_TO_IPA.items()
+    for stress, mark in (('', ''), ('0', ''), ('1', 'ˈ'), ('2', 'ˌ'))
+}
+
+# Shared, read-only result for words missing from the dictionary
+_CMU_MISS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "phonetic": MappingProxyType({
+        "ipa_transcription": None,
+        "audio_url": None
+    })
+})
+
+
+def _unknown_phone_to_ipa(phone: str) -> str:
+    """Fall back to the lowercased phone, without stress, for tokens not in the table."""
+    clean_phone = phone.rstrip('012')
+    logger.warning(f"Unknown ARPABET phoneme: {clean_phone}")
+    return clean_phone.lower()
+
+
+def arpabet_to_ipa(arpabet: Sequence[str]) -> str:
+    """
+    Convert ARPABET phonemes to IPA transcription.
+
+    Args:
+        arpabet: ARPABET phonemes (e.g., ['W', 'ER1', 'D'])
+
+    Returns:
+        IPA transcription string (e.g., '/wɜrd/')
+    """
+    # One lookup per phone, stress marker included; every table entry is non-empty
+    lookup = ARPABET_STRESSED_TO_IPA.get
+    return '/' + ''.join([
+        lookup(phone) or _unknown_phone_to_ipa(phone) for phone in arpabet
+    ]) + '/'
+
+
+# Serializes the first load: lru_cache alone lets concurrent first calls
+# (e.g. the startup preload thread and an early request) each parse the file
+_cmu_ipa_lock = threading.Lock()
+
+
+def _get_cmu_ipa() -> Dict[str, str]:
+    """
+    Get the CMU Pronouncing Dictionary as IPA, loading it once per process.
+
+    A call made while another thread is loading waits for that load instead
+    of starting a second one.
+
+    Returns:
+        Word -> IPA transcription, shared by all adapter instances
+    """
+    with _cmu_ipa_lock:
+        return _load_cmu_ipa()
+
+
+@lru_cache(maxsize=1)
+def _load_cmu_ipa() -> Dict[str, str]:
+    """
+    Load the CMU Pronouncing Dictionary, as IPA. Call _get_cmu_ipa instead.
+
+    Transcriptions are deterministic per word, so every entry is converted
+    once here and lookups are a single dict probe. Only the first (most
+    common) pronunciation of each word is used.
+
+    Returns:
+        Word -> IPA transcription
+    """
+    # Imported here so importing this module does not load NLTK
+    from nltk.corpus import cmudict
+
+    return {
+        word: arpabet_to_ipa(pronunciations[0])
+        for word, pronunciations in cmudict.dict().items()
+    }
+
+
+def preload_cmu_dictionary() -> None:
+    """
+    Load the shared CMU IPA table ahead of the first lookup.
+
+    Meant to run in a worker thread at application startup. Failures are
+    logged rather than raised; the adapter retries the load when created.
+    """
+    try:
+        cmu_ipa = _get_cmu_ipa()
+        logger.info(f"CMU Dictionary preloaded with {len(cmu_ipa)} entries")
+    except Exception as e:
+        logger.warning(f"Failed to preload CMU Dictionary: {e}")
+
+
 class CMUPhoneticAdapter(DataSourceAdapter):
     """
     Adapter for fetching phonetic transcriptions from CMU Pronouncing Dictionary.
@@ -17,28 +125,24 @@ class CMUPhoneticAdapter(DataSourceAdapter):
     - IPA phonetic transcription
     """
 
-    # ARPABET to IPA conversion mapping
-    ARPABET_TO_IPA = {
-        'AA': 'ɑ', 'AE': 'æ', 'AH': 'ə', 'AO': 'ɔ', 'AW': 'aʊ',
-        'AY': 'aɪ', 'B': 'b', 'CH': 'tʃ', 'D': 'd', 'DH': 'ð',
-        'EH': 'ɛ', 'ER': 'ɜr', 'EY': 'eɪ', 'F': 'f', 'G': 'ɡ',
-        'HH': 'h', 'IH': 'ɪ', 'IY': 'i', 'JH': 'dʒ', 'K': 'k',
-        'L': 'l', 'M': 'm', 'N': 'n', 'NG': 'ŋ', 'OW': 'oʊ',
-        'OY': 'ɔɪ', 'P': 'p', 'R': 'r', 'S': 's', 'SH': 'ʃ',
-        'T': 't', 'TH': 'θ', 'UH': 'ʊ', 'UW': 'u', 'V': 'v',
-        'W': 'w', 'Y': 'j', 'Z': 'z', 'ZH': 'ʒ'
-    }
+    # Fields this adapter can provide (see get_supported_fields)
+    supported_fields = ("phonetic", "phonetics")
+
+    # Set form of supported_fields for supports_field lookups
+    _SUPPORTED = frozenset(supported_fields)
 
     def __init__(self):
         """Initialize CMU adapter and ensure data is downloaded."""
         self._ensure_cmudict_data()
-        self.cmu_dict = cmudict.dict()
+        self.cmu_ipa = _get_cmu_ipa()
 
     def _ensure_cmudict_data(self):
         """Ensure CMU Dictionary data is available, download if necessary."""
+        import nltk
+
         try:
-            # Try to access cmudict to verify it's available
-            cmudict.dict()
+            # Locate the corpus without parsing it; it is loaded once per process
+            nltk.data.find('corpora/cmudict')
             logger.debug("CMU Dictionary data is available")
         except LookupError:
             logger.info("CMU Dictionary data not found, downloading...")
@@ -49,99 +153,71 @@ class CMUPhoneticAdapter(DataSourceAdapter):
                 logger.error(f"Failed to download CMU Dictionary data: {e}")
                 raise
 
-    async def fetch_word_data(self, word: str) -> Dict[str, Any]:
+    async def fetch_word_data(self, word: str) -> Mapping[str, Any]:
         """
         Fetch phonetic transcription from CMU Dictionary.
 
+        Async wrapper around fetch_word_data_sync; the lookup does no I/O.
+
         Args:
             word: Word text to look up (normalized)
 
         Returns:
-            Dictionary containing IPA transcription
+            Same as fetch_word_data_sync
+        """
+        return self.fetch_word_data_sync(word)
 
-        Raises:
-            Exception: If data fetching fails
+    def fetch_word_data_sync(self, word: str) -> Mapping[str, Any]:
         """
-        try:
-            logger.debug(f"Fetching CMU phonetics for: {word}")
-
-            # CMU dict uses lowercase
-            word_lower = word.lower()
-
-            if word_lower not in self.cmu_dict:
-                logger.debug(f"Word '{word}' not found in CMU Dictionary")
-                return {
-                    "phonetic": {
-                        "ipa_transcription": None,
-                        "audio_url": None
-                    }
-                }
+        Fetch phonetic transcription from CMU Dictionary without going through the event loop.
 
-            # Get first pronunciation (most common)
-            arpabet = self.cmu_dict[word_lower][0]
+        Args:
+            word: Word text to look up (normalized)
 
-            # Convert ARPABET to IPA
-            ipa = self._arpabet_to_ipa(arpabet)
+        Returns:
+            Dictionary containing IPA transcription. Misses share one
+            read-only result.
+        """
+        # CMU dict uses lowercase. Transcriptions were converted at load, so
+        # the lookup itself cannot fail and a miss is not an error.
+        ipa = self.cmu_ipa.get(word.lower())
 
-            logger.info(f"CMU phonetic for '{word}': {ipa}")
+        # Positional args: loguru only formats the message if the level is enabled
+        if ipa is None:
+            logger.debug("Word '{}' not found in CMU Dictionary", word)
+            return _CMU_MISS
 
-            return {
-                "phonetic": {
-                    "ipa_transcription": ipa,
-                    "audio_url": None
-                }
-            }
+        logger.debug("CMU phonetic for '{}': {}", word, ipa)
 
-        except Exception as e:
-            logger.error(f"CMU Dictionary error for word '{word}': {e}")
-            # Return empty result instead of failing
-            return {
-                "phonetic": {
-                    "ipa_transcription": None,
-                    "audio_url": None
-                }
+        return {
+            "phonetic": {
+                "ipa_transcription": ipa,
+                "audio_url": None
             }
+        }
 
-    def _arpabet_to_ipa(self, arpabet: list) -> str:
+    async def fetch_many(self, words: Sequence[str]) -> Dict[str, Mapping[str, Any]]:
         """
-        Convert ARPABET phonemes to IPA transcription.
+        Fetch phonetic transcriptions for several words in one call.
 
         Args:
-            arpabet: List of ARPABET phonemes (e.g., ['W', 'ER1', 'D'])
+            words: Word texts to look up (normalized)
 
         Returns:
-            IPA transcription string (e.g., '/wɜrd/')
+            Dictionary mapping each word to its fetch_word_data result
+            (IPA transcription None for words not in the dictionary)
         """
-        ipa_phones = []
-        stress_mark = ''
-
-        for phone in arpabet:
-            # Remove stress markers (0, 1, 2) from vowels
-            clean_phone = phone.rstrip('012')
-
-            # Check for primary stress
-            if phone.endswith('1'):
-                stress_mark = 'ˈ'
-            # Check for secondary stress
-            elif phone.endswith('2'):
-                stress_mark = 'ˌ'
-            else:
-                stress_mark = ''
-
-            # Convert to IPA
-            if clean_phone in self.ARPABET_TO_IPA:
-                if stress_mark:
-                    ipa_phones.append(stress_mark + self.ARPABET_TO_IPA[clean_phone])
-                else:
-                    ipa_phones.append(self.ARPABET_TO_IPA[clean_phone])
-            else:
-                logger.warning(f"Unknown ARPABET phoneme: {clean_phone}")
-                ipa_phones.append(clean_phone.lower())
-
-        # Join and wrap in slashes
-        ipa = '/' + ''.join(ipa_phones) + '/'
-
-        return ipa
+        cmu_ipa = self.cmu_ipa
+        results = {}
+        for word in words:
+            ipa = cmu_ipa.get(word.lower())
+            results[word] = _CMU_MISS if ipa is None else {
+                "phonetic": {
+                    "ipa_transcription": ipa,
+                    "audio_url": None
+                }
+            }
+        return results
 
     def supports_field(self, field: str) -> bool:
         """
@@ -153,17 +229,4 @@ class CMUPhoneticAdapter(DataSourceAdapter):
         Returns:
             True if field is supported (phonetics)
         """
-        supported_fields = {
-            "phonetic",
-            "phonetics",
-        }
-        return field in supported_fields
-
-    def get_supported_fields(self) -> list[str]:
-        """
-        Get list of all supported fields.
-
-        Returns:
-            List of field names this adapter can provide
-        """
-        return ["phonetic", "phonetics"]
+        return field in self._SUPPORTED
@@ -1,6 +1,19 @@
 """Abstract base class for data source adapters."""
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any, Dict
+from functools import cached_property
+from typing import Any, Dict, Mapping, Sequence, Tuple
+
+# Fields checked by the default supported_fields implementation
+_KNOWN_FIELDS = (
+    "phonetic",
+    "definitions",
+    "grammatical_info",
+    "learning_metadata",
+    "related_words",
+    "cefr_level",
+    "frequency_rank",
+)
 
 
 class DataSourceAdapter(ABC):
@@ -15,7 +28,7 @@ class DataSourceAdapter(ABC):
     """
 
     @abstractmethod
-    async def fetch_word_data(self, word: str) -> Dict[str, Any]:
+    async def fetch_word_data(self, word: str) -> Mapping[str, Any]:
         """
         Fetch word data from the data source.
 
@@ -23,8 +36,9 @@ class DataSourceAdapter(ABC):
             word: Word text to look up (normalized)
 
         Returns:
-            Dictionary containing word data fields supported by this adapter.
+            Mapping containing word data fields supported by this adapter.
             Structure should align with Word model and related entities.
+            It may be shared and read-only; callers must not mutate it.
 
         Raises:
             Exception: If data fetching fails
@@ -85,24 +99,41 @@ class DataSourceAdapter(ABC):
         """
         pass
 
+    async def fetch_many(self, words: Sequence[str]) -> Dict[str, Mapping[str, Any]]:
+        """
+        Fetch word data for several words at once.
+
+        Args:
+            words: Word texts to look up (normalized)
+
+        Returns:
+            Dictionary mapping each word to its fetch_word_data result
+
+        Raises:
+            Exception: If fetching any of the words fails
+
+        Note:
+            The default runs fetch_word_data concurrently for every word.
+            Adapters backed by in-memory tables should override this with
+            a plain loop to skip the per-word coroutines.
+        """
+        results = await asyncio.gather(*(self.fetch_word_data(word) for word in words))
+        return dict(zip(words, results, strict=True))
+
+    @cached_property
+    def supported_fields(self) -> Tuple[str, ...]:
+        """
+        All supported fields, computed once per adapter.
+
+        Adapters with a fixed list should override this with a class-level tuple.
+        """
+        return tuple(field for field in _KNOWN_FIELDS if self.supports_field(field))
+
     def get_supported_fields(self) -> list[str]:
         """
         Get list of all supported fields.
 
         Returns:
             List of field names this adapter can provide
-
-        Note:
-            This is a convenience method that can be overridden
-            for better performance, or it will check all known fields.
         """
-        known_fields = [
-            "phonetic",
-            "definitions",
-            "grammatical_info",
-            "learning_metadata",
-            "related_words",
-            "cefr_level",
-            "frequency_rank",
-        ]
-        return [field for field in known_fields if self.supports_field(field)]
+        return list(self.supported_fields)
@@ -1,15 +1,116 @@
 """Enrichment service orchestrating data from multiple sources."""
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+import asyncio
+import copy
+import heapq
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+from functools import lru_cache, partial
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+from datetime import UTC, datetime
 
 from loguru import logger
 
+from src.core.config import settings
 from src.services.claude_enrichment_adapter import ClaudeEnrichmentAdapter
 from src.services.wordnet_adapter import WordNetAdapter
 from src.services.cmu_phonetic_adapter import CMUPhoneticAdapter
 from src.services.cefr_adapter import CEFRAdapter
 from src.services.frequency_adapter import FrequencyAdapter
 
+# In-process cache of enrichment results, so repeat lookups of a word (e.g.
+# after a failed database write) skip the adapter round-trips
+ENRICHMENT_CACHE_MAX_SIZE = 4096
+ENRICHMENT_CACHE_TTL_SECONDS = 3600
+
+# Base strength of a related word by relationship type
+_BASE_RELATIONSHIP_STRENGTHS = {
+    "synonym": 0.9,
+    "antonym": 0.8,
+    "derivative": 0.7,
+    "hypernym": 0.6,
+    "hyponym": 0.6,
+    "related": 0.5,
+}
+# Every relationship strength, keyed by (relationship type, has usage notes,
+# from Claude). Usage notes add 0.1 (very helpful for learners), Claude as the
+# source adds 0.05 (more learner-appropriate), capped at 1.0.
+_RELATIONSHIP_STRENGTHS = {
+    (relationship_type, has_usage_notes, from_claude): min(
+        base_strength
+        + (0.1 if has_usage_notes else 0.0)
+        + (0.05 if from_claude else 0.0),
+        1.0
+    )
+    for relationship_type, base_strength in _BASE_RELATIONSHIP_STRENGTHS.items()
+    for has_usage_notes in (False, True)
+    for from_claude in (False, True)
+}
+
+# Frequency rank upper bounds (inclusive) for estimating a CEFR level, and the
+# level for each band; ranks past the last bound are C2
+_FREQUENCY_CEFR_THRESHOLDS = (100, 1000, 5000, 10000, 25000)
+_FREQUENCY_CEFR_LEVELS = ("A1", "A2", "B1", "B2", "C1", "C2")
+
+# Keywords that mark an example's context type, used by _detect_context.
+# A keyword counts once if it appears anywhere in the lowercased example.
+_CONTEXT_KEYWORDS_BY_TYPE = {
+    "academic": (
+        "research", "study", "theory", "hypothesis", "analysis",
+        "experiment", "data", "scholar", "academic", "university",
+        "thesis", "dissertation", "journal", "findings", "conclude"
+    ),
+    "business": (
+        "company", "business", "client", "customer", "market",
+        "sales", "profit", "revenue", "meeting", "project",
+        "deadline", "manager", "employee", "corporate", "office"
+    ),
+    "technical": (
+        "system", "software", "hardware", "code", "algorithm",
+        "function", "parameter", "database", "network", "protocol",
+        "interface", "configuration", "implementation"
+    ),
+    "formal": (
+        "hereby", "therefore", "furthermore", "moreover",
+        "shall", "cordially", "respectfully", "kindly",
+        "sincerely", "distinguished", "honorable"
+    ),
+}
+_CONTEXT_TYPES = tuple(_CONTEXT_KEYWORDS_BY_TYPE)
+# Flattened (keyword, context type) pairs
+_CONTEXT_KEYWORDS = tuple(
+    (keyword, context)
+    for context, keywords in _CONTEXT_KEYWORDS_BY_TYPE.items()
+    for keyword in keywords
+)
+
+# Irregular adjectives and their (comparative, superlative) forms
+_IRREGULAR_ADJECTIVES = {
+    "good": ("better", "best"),
+    "bad": ("worse", "worst"),
+    "little": ("less", "least"),
+    "much": ("more", "most"),
+    "many": ("more", "most"),
+    "far": ("farther", "farthest"),  # or further/furthest
+}
+
+# Singular endings that take -es in a regular plural (box → boxes)
+_PLURAL_ES_SUFFIXES = ("s", "x", "z", "ch", "sh")
+
+
+@lru_cache(maxsize=1)
+def _get_local_adapters() -> Tuple[WordNetAdapter, CMUPhoneticAdapter, CEFRAdapter, FrequencyAdapter]:
+    """
+    Build the local word-list adapters once per process.
+
+    They only read static word data, so every EnrichmentService shares one
+    set. The Claude adapter is created per service since it owns an API client.
+
+    Returns:
+        WordNet, CMU, CEFR and frequency adapters
+    """
+    return WordNetAdapter(), CMUPhoneticAdapter(), CEFRAdapter(), FrequencyAdapter()
+
 
 class EnrichmentService:
     """
@@ -24,10 +125,17 @@ class EnrichmentService:
     def __init__(self):
         """Initialize enrichment service with all adapters."""
         self.claude_adapter = ClaudeEnrichmentAdapter()
-        self.wordnet_adapter = WordNetAdapter()
-        self.cmu_adapter = CMUPhoneticAdapter()
-        self.cefr_adapter = CEFRAdapter()
-        self.frequency_adapter = FrequencyAdapter()
+        (
+            self.wordnet_adapter,
+            self.cmu_adapter,
+            self.cefr_adapter,
+            self.frequency_adapter,
+        ) = _get_local_adapters()
+
+        # Word -> (monotonic time stored, enriched data), least recently used first
+        self._cache: OrderedDict[str, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        # Word -> enrichment currently running for it, shared by concurrent callers
+        self._inflight: Dict[str, "asyncio.Task[Dict[str, Any]]"] = {}
 
         logger.info("EnrichmentService initialized with all adapters")
 
@@ -37,6 +145,9 @@ class EnrichmentService:
 
         Claude is the primary authoritative source. WordNet and CMU provide
         supplementary data that enhances or validates Claude's output.
+        Results are cached in process for ENRICHMENT_CACHE_TTL_SECONDS, and
+        concurrent calls for the same word share one enrichment. Each call
+        returns its own copy.
 
         Args:
             word: Word text to enrich (normalized)
@@ -45,25 +156,76 @@ class EnrichmentService:
             Comprehensive word data dictionary with all available information
 
         Raises:
+            TimeoutError: If the adapters take longer than
+                settings.enrichment_timeout_seconds
             Exception: If enrichment fails critically (e.g., Claude API error)
         """
+        cached = self._get_cached_enrichment(word)
+        if cached is not None:
+            logger.info(f"Enrichment cache hit for word: {word}")
+            return cached
+
+        task = self._inflight.get(word)
+        if task is None:
+            task = asyncio.ensure_future(self._enrich_uncached(word))
+            self._inflight[word] = task
+            task.add_done_callback(partial(self._finish_inflight, word))
+        else:
+            logger.info(f"Joining in-flight enrichment for word: {word}")
+
+        # Shielded so a cancelled caller does not cancel the enrichment other
+        # callers are waiting on. Callers mutate the result, so copy it.
+        return copy.deepcopy(await asyncio.shield(task))
+
+    async def _enrich_uncached(self, word: str) -> Dict[str, Any]:
+        """
+        Enrich a word from the adapters and cache the result.
+
+        Args:
+            word: Word text to enrich (normalized)
+
+        Returns:
+            Enriched data, shared with the cache; callers must not mutate it
+
+        Raises:
+            Exception: See enrich_word
+        """
         logger.info(f"Starting enrichment for word: {word}")
 
+        # One timestamp per enrichment, as naive UTC because last_enriched_at
+        # is stored without a time zone
+        enriched_at = datetime.now(UTC).replace(tzinfo=None)
+
         try:
-            # Fetch data from Claude (primary source - REQUIRED)
-            claude_data = await self.claude_adapter.fetch_word_data(word)
+            # Fetch from the remote and disk-backed adapters concurrently, so
+            # WordNet and frequency lookups overlap the Claude request
+            async with asyncio.timeout(settings.enrichment_timeout_seconds):
+                claude_data, wordnet_data, frequency_data = await asyncio.gather(
+                    # Claude (primary source - REQUIRED)
+                    self.claude_adapter.fetch_word_data(word),
+                    # Supplementary synonyms and antonyms from WordNet
+                    self.wordnet_adapter.fetch_word_data(word),
+                    # Frequency data
+                    self.frequency_adapter.fetch_word_data(word),
+                    return_exceptions=True
+                )
 
-            # Fetch supplementary data from WordNet (synonyms, antonyms)
-            wordnet_data = await self.wordnet_adapter.fetch_word_data(word)
+            if isinstance(claude_data, BaseException):
+                raise claude_data
 
-            # Fetch supplementary phonetics from CMU
-            cmu_data = await self.cmu_adapter.fetch_word_data(word)
+            # Supplementary sources are optional; enrich without them on failure
+            if isinstance(wordnet_data, BaseException):
+                logger.warning(f"WordNet lookup failed for '{word}': {wordnet_data}")
+                wordnet_data = {}
+            if isinstance(frequency_data, BaseException):
+                logger.warning(f"Frequency lookup failed for '{word}': {frequency_data}")
+                frequency_data = {}
 
-            # Fetch CEFR difficulty level
-            cefr_data = await self.cefr_adapter.fetch_word_data(word)
+            # Fetch supplementary phonetics from CMU (in-memory, no await needed)
+            cmu_data = self.cmu_adapter.fetch_word_data_sync(word)
 
-            # Fetch frequency data
-            frequency_data = await self.frequency_adapter.fetch_word_data(word)
+            # Fetch CEFR difficulty level (in-memory, no await needed)
+            cefr_data = self.cefr_adapter.fetch_word_data_sync(word)
 
             # Merge all data sources
             enriched_data = self._merge_data_sources(
@@ -72,7 +234,8 @@ class EnrichmentService:
                 wordnet_data=wordnet_data,
                 cmu_data=cmu_data,
                 cefr_data=cefr_data,
-                frequency_data=frequency_data
+                frequency_data=frequency_data,
+                enriched_at=enriched_at
             )
 
             # Validate completeness
@@ -81,20 +244,105 @@ class EnrichmentService:
             logger.info(f"Successfully enriched word: {word}")
             logger.debug(f"Enriched data for '{word}': {enriched_data}")
 
+            self._cache_enrichment(word, enriched_data)
+
             return enriched_data
 
         except Exception as e:
             logger.error(f"Enrichment failed for word '{word}': {e}")
             raise
 
+    async def bulk_enrich(
+        self,
+        words: List[str],
+        limit: int = 10
+    ) -> List[Any]:
+        """
+        Enrich many words with a cap on concurrent enrichments.
+
+        Every enrichment calls the Claude API, so an unbounded gather over a
+        large word list would trip its rate limit. Size limit to the Claude
+        request budget; each enrichment is already bounded by
+        settings.enrichment_timeout_seconds, so one stuck call cannot stall
+        the batch.
+
+        Args:
+            words: Word texts to enrich (normalized)
+            limit: Maximum number of enrichments in flight at once
+
+        Returns:
+            One entry per word, in order: the enriched data, or the exception
+            that enrichment raised for that word
+        """
+        semaphore = asyncio.Semaphore(limit)
+
+        async def enrich_one(word: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.enrich_word(word)
+
+        return await asyncio.gather(
+            *(enrich_one(word) for word in words),
+            return_exceptions=True
+        )
+
+    def _get_cached_enrichment(self, word: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a copy of a cached enrichment result.
+
+        Args:
+            word: Word text (normalized)
+
+        Returns:
+            Copy of the enriched data, or None if absent or expired
+        """
+        entry = self._cache.get(word)
+        if entry is None:
+            return None
+
+        stored_at, enriched_data = entry
+        if time.monotonic() - stored_at >= ENRICHMENT_CACHE_TTL_SECONDS:
+            del self._cache[word]
+            return None
+
+        self._cache.move_to_end(word)
+        # Callers mutate the result (e.g. _cache_status), so never hand out the cached dict
+        return copy.deepcopy(enriched_data)
+
+    def _finish_inflight(self, word: str, task: "asyncio.Task[Dict[str, Any]]") -> None:
+        """
+        Forget a finished in-flight enrichment.
+
+        Args:
+            word: Word text (normalized)
+            task: The finished enrichment task
+        """
+        self._inflight.pop(word, None)
+        # Mark a failure as retrieved; if every caller was cancelled, nobody else will
+        if not task.cancelled():
+            task.exception()
+
+    def _cache_enrichment(self, word: str, enriched_data: Dict[str, Any]) -> None:
+        """
+        Cache an enrichment result, evicting the least recently used entry if full.
+
+        Args:
+            word: Word text (normalized)
+            enriched_data: Enriched data; only ever copied out of the cache
+        """
+        self._cache[word] = (time.monotonic(), enriched_data)
+        self._cache.move_to_end(word)
+        if len(self._cache) > ENRICHMENT_CACHE_MAX_SIZE:
+            self._cache.popitem(last=False)
+
     def _merge_data_sources(
         self,
         word: str,
         claude_data: Dict[str, Any],
         wordnet_data: Dict[str, Any],
-        cmu_data: Dict[str, Any],
-        cefr_data: Dict[str, Any],
-        frequency_data: Dict[str, Any]
+        cmu_data: Mapping[str, Any],
+        cefr_data: Mapping[str, Any],
+        frequency_data: Dict[str, Any],
+        enriched_at: datetime
     ) -> Dict[str, Any]:
         """
         Merge data from all sources with Claude as authoritative source.
@@ -106,6 +354,7 @@ class EnrichmentService:
             cmu_data: Data from CMU Dictionary
             cefr_data: Data from CEFR adapter
             frequency_data: Data from frequency adapter
+            enriched_at: When the enrichment ran (naive UTC)
 
         Returns:
             Merged word data dictionary
@@ -116,7 +365,7 @@ class EnrichmentService:
         merged = {
             "word_text": word,
             "language": "en",
-            "last_enriched_at": datetime.utcnow()
+            "last_enriched_at": enriched_at
         }
 
         # Phonetics: Prefer Claude, fallback to CMU
@@ -236,16 +485,14 @@ class EnrichmentService:
                     )
                 }
 
-        # Convert to list and sort by strength (highest first)
-        unique_related = sorted(
+        # Keep the top 15 related words by strength (highest first). Same result
+        # as a full stable sort plus slice, without sorting the whole list.
+        unique_related = heapq.nlargest(
+            15,
             word_data.values(),
-            key=lambda x: x.get("strength", 0.0),
-            reverse=True
+            key=lambda x: x.get("strength", 0.0)
         )
 
-        # Limit to top 15 related words
-        unique_related = unique_related[:15]
-
         logger.debug(f"Merged {len(unique_related)} unique related words with strength scores")
 
         return unique_related
@@ -265,33 +512,19 @@ class EnrichmentService:
             source: Data source (claude or wordnet)
 
         Returns:
-            Strength score between 0.0 and 1.0
+            Strength score between 0.0 and 1.0 (see _RELATIONSHIP_STRENGTHS)
         """
-        # Base strength by relationship type
-        base_strength = {
-            "synonym": 0.9,
-            "antonym": 0.8,
-            "derivative": 0.7,
-            "hypernym": 0.6,
-            "hyponym": 0.6,
-            "related": 0.5,
-        }.get(relationship_type, 0.5)
-
-        # Boost for having usage notes (very helpful for learners)
-        if has_usage_notes:
-            base_strength += 0.1
-
-        # Slight boost for Claude source (more learner-appropriate)
-        if source == "claude":
-            base_strength += 0.05
-
-        # Cap at 1.0
-        return min(base_strength, 1.0)
+        # Unknown relationship types score like "related"
+        key = (relationship_type, bool(has_usage_notes), source == "claude")
+        strength = _RELATIONSHIP_STRENGTHS.get(key)
+        if strength is None:
+            strength = _RELATIONSHIP_STRENGTHS[("related",) + key[1:]]
+        return strength
 
     def _merge_learning_metadata(
         self,
         word: str,
-        cefr_data: Dict[str, Any],
+        cefr_data: Mapping[str, Any],
         frequency_data: Dict[str, Any],
         claude_data: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -319,16 +552,17 @@ class EnrichmentService:
             "frequency_band": None,
             "style_tags": []
         }
+        claude_metadata = claude_data.get("learning_metadata") or {}
 
         # CEFR/Difficulty level: Prefer CEFR adapter, fallback to Claude estimation
         if cefr_data.get("cefr_level"):
             metadata["difficulty_level"] = cefr_data["cefr_level"]
             metadata["cefr_level"] = cefr_data["cefr_level"]
             logger.debug(f"Using CEFR level from adapter for '{word}': {cefr_data['cefr_level']}")
-        elif claude_data.get("learning_metadata", {}).get("cefr_level"):
+        elif claude_metadata.get("cefr_level"):
             # Claude can estimate CEFR level for words not in CEFR-J wordlist
-            metadata["difficulty_level"] = claude_data["learning_metadata"]["cefr_level"]
-            metadata["cefr_level"] = claude_data["learning_metadata"]["cefr_level"]
+            metadata["difficulty_level"] = claude_metadata["cefr_level"]
+            metadata["cefr_level"] = claude_metadata["cefr_level"]
             logger.debug(f"Using Claude-estimated CEFR level for '{word}': {metadata['cefr_level']}")
         else:
             # Estimate based on frequency if available
@@ -347,8 +581,8 @@ class EnrichmentService:
             )
 
         # Style tags: From Claude (if available)
-        if claude_data.get("learning_metadata", {}).get("style_tags"):
-            metadata["style_tags"] = claude_data["learning_metadata"]["style_tags"]
+        if claude_metadata.get("style_tags"):
+            metadata["style_tags"] = claude_metadata["style_tags"]
 
         return metadata
 
@@ -375,19 +609,8 @@ class EnrichmentService:
         if not frequency_rank:
             return None
 
-        # Map frequency rank to CEFR level
-        if frequency_rank <= 100:
-            return "A1"
-        elif frequency_rank <= 1000:
-            return "A2"
-        elif frequency_rank <= 5000:
-            return "B1"
-        elif frequency_rank <= 10000:
-            return "B2"
-        elif frequency_rank <= 25000:
-            return "C1"
-        else:
-            return "C2"
+        # Map frequency rank to CEFR level (bisect_left: thresholds are inclusive)
+        return _FREQUENCY_CEFR_LEVELS[bisect_left(_FREQUENCY_CEFR_THRESHOLDS, frequency_rank)]
 
     def _validate_enriched_data(self, data: Dict[str, Any]) -> None:
         """
@@ -449,25 +672,31 @@ class EnrichmentService:
         """
         processed_examples = []
         valid_contexts = {"casual", "academic", "business", "technical", "formal"}
+        # Lowercased once here and shared by the context and quality checks
+        word_lower = word_text.lower()
 
         for idx, example in enumerate(examples):
             # Handle both string and dict formats
             if isinstance(example, str):
                 example_text = example
-                context_type = self._detect_context(example_text)
+                example_lower = example_text.lower()
+                context_type = self._detect_context(example_text, example_lower)
             elif isinstance(example, dict):
                 example_text = example.get("example_text", "")
+                example_lower = example_text.lower() if example_text else ""
                 context_type = example.get("context_type")
 
                 # If context_type is missing or invalid, auto-detect
                 if not context_type or context_type not in valid_contexts:
-                    context_type = self._detect_context(example_text)
+                    context_type = self._detect_context(example_text, example_lower)
             else:
                 logger.warning(f"Invalid example format at index {idx}: {type(example)}")
                 continue
 
             # Validate example quality
-            if not self._validate_example_quality(example_text, word_text):
+            if not self._validate_example_quality(
+                example_text, word_text, example_lower, word_lower
+            ):
                 logger.warning(f"Example failed quality check: {example_text}")
                 continue
 
@@ -479,7 +708,7 @@ class EnrichmentService:
         logger.debug(f"Processed {len(processed_examples)} valid examples from {len(examples)} total")
         return processed_examples
 
-    def _detect_context(self, example_text: str) -> str:
+    def _detect_context(self, example_text: str, example_lower: Optional[str] = None) -> str:
         """
         Detect the context type of an example sentence.
 
@@ -487,95 +716,85 @@ class EnrichmentService:
 
         Args:
             example_text: Example sentence
+            example_lower: example_text already lowercased (computed if omitted)
 
         Returns:
             Context type: 'casual', 'academic', 'business', 'technical', or 'formal'
         """
-        example_lower = example_text.lower()
+        if example_lower is None:
+            example_lower = example_text.lower()
 
-        # Academic context keywords
-        academic_keywords = [
-            "research", "study", "theory", "hypothesis", "analysis",
-            "experiment", "data", "scholar", "academic", "university",
-            "thesis", "dissertation", "journal", "findings", "conclude"
+        # One pass over every keyword; only the hits are tallied
+        matched_contexts = [
+            context for keyword, context in _CONTEXT_KEYWORDS if keyword in example_lower
         ]
 
-        # Business context keywords
-        business_keywords = [
-            "company", "business", "client", "customer", "market",
-            "sales", "profit", "revenue", "meeting", "project",
-            "deadline", "manager", "employee", "corporate", "office"
-        ]
-
-        # Technical context keywords
-        technical_keywords = [
-            "system", "software", "hardware", "code", "algorithm",
-            "function", "parameter", "database", "network", "protocol",
-            "interface", "configuration", "implementation"
-        ]
-
-        # Formal context keywords
-        formal_keywords = [
-            "hereby", "therefore", "furthermore", "moreover",
-            "shall", "cordially", "respectfully", "kindly",
-            "sincerely", "distinguished", "honorable"
-        ]
+        # If no keywords matched, default to casual
+        if not matched_contexts:
+            return "casual"
 
-        # Count keyword matches
-        academic_score = sum(1 for kw in academic_keywords if kw in example_lower)
-        business_score = sum(1 for kw in business_keywords if kw in example_lower)
-        technical_score = sum(1 for kw in technical_keywords if kw in example_lower)
-        formal_score = sum(1 for kw in formal_keywords if kw in example_lower)
-
-        # Determine context based on highest score
-        scores = {
-            "academic": academic_score,
-            "business": business_score,
-            "technical": technical_score,
-            "formal": formal_score
-        }
+        # Count keyword matches per context
+        scores = dict.fromkeys(_CONTEXT_TYPES, 0)
+        for context in matched_contexts:
+            scores[context] += 1
 
         max_score = max(scores.values())
 
-        # If no keywords matched, default to casual
-        if max_score == 0:
-            return "casual"
-
-        # Return context with highest score (ties default to casual)
+        # Return context with highest score (ties go to the first context listed)
         for context, score in scores.items():
             if score == max_score:
                 return context
 
         return "casual"
 
-    def _validate_example_quality(self, example_text: str, word_text: str) -> bool:
+    def _validate_example_quality(
+        self,
+        example_text: str,
+        word_text: str,
+        example_lower: Optional[str] = None,
+        word_lower: Optional[str] = None
+    ) -> bool:
         """
         Validate that an example meets quality standards.
 
         Args:
             example_text: Example sentence to validate
             word_text: The word that should appear in the example
+            example_lower: example_text already lowercased (computed if omitted)
+            word_lower: word_text already lowercased (computed if omitted)
 
         Returns:
             True if example passes quality checks, False otherwise
         """
-        # Check 1: Example text exists and is non-empty
-        if not example_text or len(example_text.strip()) == 0:
+        # Checks run cheapest first; they all have to pass, so the order only
+        # decides how early a bad example is rejected.
+
+        # Check 1: Example text exists
+        if not example_text:
             return False
 
         # Check 2: Length is within bounds (5-300 characters)
-        if len(example_text) < 5 or len(example_text) > 300:
-            logger.debug(f"Example length out of bounds: {len(example_text)} chars")
+        example_length = len(example_text)
+        if example_length < 5 or example_length > 300:
+            logger.debug(f"Example length out of bounds: {example_length} chars")
             return False
 
-        # Check 3: Example contains the target word (case-insensitive)
-        if word_text.lower() not in example_text.lower():
+        # Check 3: Example looks like natural language (contains spaces and reasonable punctuation)
+        if " " not in example_text:
+            logger.debug(f"Example appears to be a single word, not a sentence: {example_text}")
+            return False
+
+        # Check 4: Example contains the target word (case-insensitive)
+        if example_lower is None:
+            example_lower = example_text.lower()
+        if word_lower is None:
+            word_lower = word_text.lower()
+        if word_lower not in example_lower:
             logger.debug(f"Example does not contain word '{word_text}': {example_text}")
             return False
 
-        # Check 4: Example looks like natural language (contains spaces and reasonable punctuation)
-        if " " not in example_text:
-            logger.debug(f"Example appears to be a single word, not a sentence: {example_text}")
+        # Check 5: Example is not just whitespace (the only check that allocates)
+        if not example_text.strip():
             return False
 
         # Quality checks passed
@@ -676,7 +895,15 @@ class EnrichmentService:
         if not grammatical_info:
             return {}
 
-        validated = grammatical_info.copy()
+        # Copy on first write only; regular words come back as the input dict
+        validated = grammatical_info
+
+        def writable() -> Dict[str, Any]:
+            nonlocal validated
+            if validated is grammatical_info:
+                validated = grammatical_info.copy()
+            return validated
+
         part_of_speech = validated.get("part_of_speech", "").lower()
 
         # Validate verb forms
@@ -692,7 +919,7 @@ class EnrichmentService:
         if has_any_verb_form or part_of_speech == "verb":
             # If any verb field is populated, base form must be present
             if not validated.get("verb_base"):
-                validated["verb_base"] = word
+                writable()["verb_base"] = word
                 logger.debug(f"Added missing verb_base for '{word}'")
 
             # Check for irregular verb forms
@@ -708,7 +935,7 @@ class EnrichmentService:
                     if not irregular_json.get("irregular_verb"):
                         irregular_json["irregular_verb"] = True
                         irregular_json["note"] = f"Irregular verb: {validated['verb_base']}/{validated.get('verb_past_simple')}/{validated.get('verb_past_participle')}"
-                        validated["irregular_forms_json"] = irregular_json
+                        writable()["irregular_forms_json"] = irregular_json
                         logger.debug(f"Flagged irregular verb: {word}")
 
         # Validate adjective forms
@@ -724,7 +951,7 @@ class EnrichmentService:
                 if not irregular_json.get("irregular_comparison"):
                     irregular_json["irregular_comparison"] = True
                     irregular_json["note"] = f"Irregular adjective: {word}/{validated['adj_comparative']}/{validated['adj_superlative']}"
-                    validated["irregular_forms_json"] = irregular_json
+                    writable()["irregular_forms_json"] = irregular_json
                     logger.debug(f"Flagged irregular adjective: {word}")
 
         # Validate noun plural forms
@@ -736,7 +963,7 @@ class EnrichmentService:
                 if not irregular_json.get("irregular_plural"):
                     irregular_json["irregular_plural"] = True
                     irregular_json["note"] = f"Irregular plural: {word} → {validated['plural_form']}"
-                    validated["irregular_forms_json"] = irregular_json
+                    writable()["irregular_forms_json"] = irregular_json
                     logger.debug(f"Flagged irregular plural: {word} → {validated['plural_form']}")
 
         return validated
@@ -756,24 +983,31 @@ class EnrichmentService:
         if not past or not base:
             return False
 
-        # Regular verbs typically add -ed to base form
-        # Check if past form doesn't follow regular pattern
-        regular_past = base + "ed" if not base.endswith("e") else base + "d"
+        # Regular verbs typically add -ed to base form. The regular past is
+        # base[:stem_length] + suffix; it is matched piecewise rather than built.
+        stem_length = len(base)
+        suffix = "ed" if not base.endswith("e") else "d"
 
         # Handle consonant doubling (stop → stopped)
         if len(base) >= 2 and base[-1] not in "aeiou" and base[-2] in "aeiou":
-            regular_past = base + base[-1] + "ed"
+            suffix = base[-1].lower() + "ed"
 
         # Handle y → ied (try → tried)
         if base.endswith("y") and len(base) > 2 and base[-2] not in "aeiou":
-            regular_past = base[:-1] + "ied"
+            stem_length -= 1
+            suffix = "ied"
 
         # If past doesn't match regular form, it's irregular
-        if past.lower() != regular_past.lower():
+        past_lower = past.lower()
+        if not (
+            len(past_lower) == stem_length + len(suffix)
+            and past_lower.endswith(suffix)
+            and past_lower.startswith(base.lower()[:stem_length])
+        ):
             return True
 
         # If past participle differs from past simple, it's irregular
-        if past_part and past_part.lower() != past.lower():
+        if past_part and past_part.lower() != past_lower:
             return True
 
         return False
@@ -792,18 +1026,9 @@ class EnrichmentService:
         """
         # Regular adjectives add -er/-est or use more/most
         # Check for irregular patterns (good/better/best, bad/worse/worst)
-        irregular_patterns = {
-            "good": ("better", "best"),
-            "bad": ("worse", "worst"),
-            "little": ("less", "least"),
-            "much": ("more", "most"),
-            "many": ("more", "most"),
-            "far": ("farther", "farthest"),  # or further/furthest
-        }
-
-        base_lower = base.lower()
-        if base_lower in irregular_patterns:
-            expected_comp, expected_sup = irregular_patterns[base_lower]
+        expected_forms = _IRREGULAR_ADJECTIVES.get(base.lower())
+        if expected_forms is not None:
+            expected_comp, expected_sup = expected_forms
             if comparative.lower() == expected_comp and superlative.lower() == expected_sup:
                 return True
 
@@ -833,25 +1058,28 @@ class EnrichmentService:
         Returns:
             True if irregular, False otherwise
         """
-        # Regular plurals typically add -s or -es
-        regular_plural = singular + "s"
-
-        # Handle -es cases (box → boxes, church → churches)
-        if singular.endswith(("s", "x", "z", "ch", "sh")):
-            regular_plural = singular + "es"
-
-        # Handle consonant + y → ies (baby → babies)
-        if singular.endswith("y") and len(singular) > 1 and singular[-2] not in "aeiou":
-            regular_plural = singular[:-1] + "ies"
-
-        # Handle -f/-fe → -ves (knife → knives, leaf → leaves)
-        if singular.endswith("f"):
-            regular_plural = singular[:-1] + "ves"
-        elif singular.endswith("fe"):
-            regular_plural = singular[:-2] + "ves"
+        # Regular plurals typically add -s or -es. The endings below are
+        # disjoint, so the last character picks the one rule that can apply.
+        last = singular[-1:]
+        stem, suffix = singular, "s"
+
+        if last == "y":
+            # Handle consonant + y → ies (baby → babies)
+            if len(singular) > 1 and singular[-2] not in "aeiou":
+                stem, suffix = singular[:-1], "ies"
+        elif last == "f":
+            # Handle -f → -ves (leaf → leaves)
+            stem, suffix = singular[:-1], "ves"
+        elif last == "e":
+            # Handle -fe → -ves (knife → knives)
+            if singular[-2:] == "fe":
+                stem, suffix = singular[:-2], "ves"
+        elif singular.endswith(_PLURAL_ES_SUFFIXES):
+            # Handle -es cases (box → boxes, church → churches)
+            suffix = "es"
 
         # If plural doesn't match regular form, it's irregular
-        if plural.lower() != regular_plural.lower():
+        if plural.lower() != (stem + suffix).lower():
             return True
 
         return False
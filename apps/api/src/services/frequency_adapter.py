@@ -17,6 +17,14 @@ class FrequencyAdapter(DataSourceAdapter):
     COCA (Corpus of Contemporary American English) with 50,000+ words.
     """
 
+    # Fields this adapter can provide (see get_supported_fields)
+    supported_fields = ("frequency_rank", "frequency_band")
+
+    # Every accepted field name, aliases included (see supports_field)
+    _SUPPORTED = frozenset({
+        "frequency_rank", "frequency_band", "frequency", "rank", "band"
+    })
+
     def __init__(self):
         """Initialize frequency adapter with basic frequency rankings."""
         # Simplified frequency rankings for common words
@@ -205,19 +213,7 @@ class FrequencyAdapter(DataSourceAdapter):
         Returns:
             True if field is supported (frequency_rank, frequency_band, frequency)
         """
-        supported_fields = {
-            "frequency_rank", "frequency_band", "frequency", "rank", "band"
-        }
-        return field in supported_fields
-
-    def get_supported_fields(self) -> list[str]:
-        """
-        Get list of all supported fields.
-
-        Returns:
-            List of field names this adapter can provide
-        """
-        return ["frequency_rank", "frequency_band"]
+        return field in self._SUPPORTED
 
     def get_rank(self, word: str) -> Optional[int]:
         """
@@ -1,9 +1,113 @@
 """Spelling suggestion service for word lookups."""
-from typing import List
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 
 from loguru import logger
 
 
+def _char_signature(word: str) -> int:
+    """
+    Bitmask of the characters in a word, one bit per character.
+
+    Every a-z letter gets its own bit; other characters may share bits.
+    """
+    signature = 0
+    for char in word:
+        signature |= 1 << (ord(char) & 63)
+    return signature
+
+
+class _BKTree:
+    """
+    BK-tree over a word set for edit distance range queries.
+
+    Each child edge is labelled with the child's distance to its parent. By
+    the triangle inequality, words within max_distance of a query can only
+    sit under edges labelled within max_distance of the query's distance to
+    the parent, so a search skips every other subtree.
+
+    Nodes also keep a character signature of their word. Every character of
+    one word missing from the other takes at least one edit, so comparing
+    signatures gives a lower bound on the distance that rules out most
+    nodes without computing it.
+    """
+
+    __slots__ = ("_distance", "_root")
+
+    def __init__(self, distance: Callable[[str, str, Optional[int]], int]):
+        """
+        Initialize an empty tree.
+
+        Args:
+            distance: Edit distance function (must be a metric). Called as
+                distance(a, b, bound); may return bound + 1 for any distance
+                above bound.
+        """
+        self._distance = distance
+        # Node: (word, character signature, {edge distance: child node})
+        self._root: Optional[Tuple[str, int, Dict[int, tuple]]] = None
+
+    def add(self, word: str) -> None:
+        """
+        Add a word; adding a word already in the tree is a no-op.
+
+        Args:
+            word: Word to add
+        """
+        node = (word, _char_signature(word), {})
+        if self._root is None:
+            self._root = node
+            return
+
+        node_word, _, children = self._root
+        while True:
+            distance = self._distance(word, node_word, None)
+            if distance == 0:
+                return
+            child = children.get(distance)
+            if child is None:
+                children[distance] = node
+                return
+            node_word, _, children = child
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[str, int]]:
+        """
+        Find all words within an edit distance of a word.
+
+        Args:
+            word: Query word
+            max_distance: Maximum edit distance (inclusive)
+
+        Returns:
+            (word, distance) pairs in no particular order
+        """
+        matches = []
+        if self._root is None:
+            return matches
+
+        signature = _char_signature(word)
+        stack = [self._root]
+        while stack:
+            node_word, node_signature, children = stack.pop()
+            # Past max_distance beyond the largest edge, no child qualifies,
+            # so the exact distance is only needed up to there
+            bound = max_distance + max(children) if children else max_distance
+            lower_bound = max(
+                (signature & ~node_signature).bit_count(),
+                (node_signature & ~signature).bit_count()
+            )
+            if lower_bound > bound:
+                continue
+            distance = self._distance(word, node_word, bound)
+            if distance <= max_distance:
+                matches.append((node_word, distance))
+            for edge, child in children.items():
+                if distance - max_distance <= edge <= distance + max_distance:
+                    stack.append(child)
+
+        return matches
+
+
 class SpellingService:
     """
     Service for generating spelling suggestions using Levenshtein distance.
@@ -16,6 +120,8 @@ class SpellingService:
         # Load common word list for suggestions (simple implementation)
         # In production, this could load from a file or database
         self.common_words = set()
+        # Same words indexed for edit distance range queries
+        self._word_index = _BKTree(self._levenshtein_distance)
         self._load_common_words()
 
     def _load_common_words(self) -> None:
@@ -48,6 +154,11 @@ class SpellingService:
             "receive", "believe", "achieve", "perceive", "conceive", "deceive",
         ]
         self.common_words = set(w.lower() for w in common)
+        # Insert shortest words first (then alphabetically): short words near
+        # the root spread the tree more evenly than set order, and the shape
+        # no longer depends on the process's hash seed
+        for common_word in sorted(self.common_words, key=lambda w: (len(w), w)):
+            self._word_index.add(common_word)
         logger.info(f"Loaded {len(self.common_words)} common words for spelling suggestions")
 
     def suggest_similar_words(self, word: str, max_distance: int = 2, max_suggestions: int = 3) -> List[str]:
@@ -67,14 +178,12 @@ class SpellingService:
 
         word_lower = word.lower()
 
-        # Calculate edit distance for all common words
-        suggestions = []
-
-        for candidate in self.common_words:
-            distance = self._levenshtein_distance(word_lower, candidate)
-
-            if distance <= max_distance and distance > 0:  # Don't suggest exact matches
-                suggestions.append((candidate, distance))
+        # Find common words within max_distance without scoring every word
+        suggestions = [
+            (candidate, distance)
+            for candidate, distance in self._word_index.search(word_lower, max_distance)
+            if distance > 0  # Don't suggest exact matches
+        ]
 
         # Sort by distance (closest first), then alphabetically
         suggestions.sort(key=lambda x: (x[1], x[0]))
@@ -89,7 +198,7 @@ class SpellingService:
 
         return suggested_words
 
-    def _levenshtein_distance(self, s1: str, s2: str) -> int:
+    def _levenshtein_distance(self, s1: str, s2: str, bound: Optional[int] = None) -> int:
         """
         Calculate Levenshtein distance between two strings.
 
@@ -100,44 +209,64 @@ class SpellingService:
         Args:
             s1: First string
             s2: Second string
+            bound: Largest distance the caller cares about (default: no limit)
 
         Returns:
-            Edit distance as integer
+            Edit distance as integer, or bound + 1 if it exceeds bound
         """
-        # Create a matrix to store distances
+        # Only the previous row of the matrix is needed, so keep two rows
+        # sized to the shorter string
+        if len(s1) < len(s2):
+            s1, s2 = s2, s1
         len1, len2 = len(s1), len(s2)
 
+        if bound is None:
+            bound = len1
+        elif len1 - len2 > bound:
+            return bound + 1
+
         # If one string is empty, distance is length of the other
-        if len1 == 0:
-            return len2
         if len2 == 0:
             return len1
 
-        # Initialize matrix
-        matrix = [[0] * (len2 + 1) for _ in range(len1 + 1)]
-
-        # Fill first row and column
-        for i in range(len1 + 1):
-            matrix[i][0] = i
-        for j in range(len2 + 1):
-            matrix[0][j] = j
-
-        # Calculate distances
-        for i in range(1, len1 + 1):
-            for j in range(1, len2 + 1):
-                if s1[i - 1] == s2[j - 1]:
-                    cost = 0  # Characters match, no operation needed
-                else:
-                    cost = 1  # Characters differ, substitution needed
-
-                matrix[i][j] = min(
-                    matrix[i - 1][j] + 1,      # Deletion
-                    matrix[i][j - 1] + 1,      # Insertion
-                    matrix[i - 1][j - 1] + cost  # Substitution
+        # Cells more than bound off the diagonal cannot lead to a distance
+        # within bound (Ukkonen), so each row only fills that band; cells
+        # beyond it count as bound + 1
+        over = bound + 1
+        previous = [j if j <= bound else over for j in range(len2 + 1)]
+        current = [over] * (len2 + 1)
+
+        # With the band as wide as the matrix, no row can end past bound
+        banded = bound < len1
+
+        for i, c1 in enumerate(s1, 1):
+            if i > bound:
+                low = i - bound
+                current[low - 1] = over
+            else:
+                low = 1
+                current[0] = i
+            high = i + bound
+            if high < len2:
+                current[high + 1] = over
+            else:
+                high = len2
+            for j in range(low, high + 1):
+                cost = 0 if c1 == s2[j - 1] else 1
+                current[j] = min(
+                    previous[j] + 1,         # Deletion
+                    current[j - 1] + 1,      # Insertion
+                    previous[j - 1] + cost   # Substitution
                 )
 
-        # Return bottom-right cell (final distance)
-        return matrix[len1][len2]
+            # Row minimums never decrease, so stop once every cell is past bound
+            if banded and min(current[low - 1:high + 1]) > bound:
+                return over
+
+            previous, current = current, previous
+
+        # After the last swap, previous holds the final row
+        return min(previous[len2], over)
 
     def add_word_to_dictionary(self, word: str) -> None:
         """
@@ -150,4 +279,20 @@ class SpellingService:
             word: Word to add to dictionary
         """
         if word:
-            self.common_words.add(word.lower())
+            word_lower = word.lower()
+            self.common_words.add(word_lower)
+            self._word_index.add(word_lower)
+
+
+@lru_cache(maxsize=1)
+def get_spelling_service() -> SpellingService:
+    """
+    Get the process-wide SpellingService.
+
+    Building the service loads the word list and its BK-tree index, so it is
+    done once and shared by every WordService.
+
+    Returns:
+        Shared SpellingService instance
+    """
+    return SpellingService()
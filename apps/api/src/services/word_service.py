@@ -1,6 +1,6 @@
 """Core business logic for word lookups."""
 from typing import Any, Dict, Optional
-from datetime import datetime
+from datetime import UTC, datetime
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,7 +10,7 @@ from src.models.word import Word
 from src.repositories.word_repository import WordRepository
 from src.core.cache import CacheService
 from src.services.enrichment_service import EnrichmentService
-from src.services.spelling_service import SpellingService
+from src.services.spelling_service import get_spelling_service
 
 
 class WordService:
@@ -44,9 +44,64 @@ class WordService:
         self.cache_service = cache_service
         self.enrichment_service = enrichment_service
         self.word_repository = WordRepository(db)
-        self.spelling_service = SpellingService()
+        self.spelling_service = get_spelling_service()
 
-    async def lookup_word(self, word: str) -> Dict[str, Any]:
+    async def get_cached_word_json(self, word: str) -> Optional[str]:
+        """
+        Get the cached word data as a raw JSON string.
+
+        Lets callers validate the cached document straight into a response
+        model instead of decoding it into an intermediate dict first.
+
+        Args:
+            word: Word text to lookup (should be normalized)
+
+        Returns:
+            Cached JSON document or None on a cache miss
+        """
+        word_normalized = word.lower().strip()
+        cached = await self.cache_service.get_cached_word_json(word_normalized)
+        if cached is not None:
+            logger.info(f"Cache HIT for word: {word_normalized}")
+        return cached
+
+    async def get_cached_response(self, word: str) -> Optional[str]:
+        """
+        Get the cached, fully rendered lookup response for a word.
+
+        Args:
+            word: Word text to lookup (should be normalized)
+
+        Returns:
+            Cached response body (JSON) or None on a cache miss
+        """
+        word_normalized = word.lower().strip()
+        cached = await self.cache_service.get_cached_response(word_normalized)
+        if cached is not None:
+            logger.info(f"Cache HIT for word: {word_normalized}")
+        return cached
+
+    async def cache_response(
+        self,
+        word: str,
+        body: bytes,
+        frequency_rank: Optional[int] = None
+    ) -> None:
+        """
+        Cache a fully rendered lookup response for a word.
+
+        Args:
+            word: Word text (should be normalized)
+            body: Rendered JSON response body
+            frequency_rank: Word frequency rank (for TTL determination)
+        """
+        await self.cache_service.set_cached_response(
+            word.lower().strip(),
+            body,
+            frequency_rank=frequency_rank
+        )
+
+    async def lookup_word(self, word: str, check_cache: bool = True) -> Dict[str, Any]:
         """
         Lookup word with comprehensive data.
 
@@ -54,6 +109,8 @@ class WordService:
 
         Args:
             word: Word text to lookup (should be normalized)
+            check_cache: Whether to check the cache first (False if the caller
+                already did, e.g. via get_cached_word_json)
 
         Returns:
             Dictionary containing comprehensive word data
@@ -66,29 +123,27 @@ class WordService:
         logger.info(f"Looking up word: {word_normalized}")
 
         # Step 1: Check cache
-        cached_data = await self.cache_service.get_cached_word(word_normalized)
-        if cached_data:
-            logger.info(f"Cache HIT for word: {word_normalized}")
-            cached_data["_cache_status"] = "HIT"
-            return cached_data
+        if check_cache:
+            cached_data = await self.cache_service.get_cached_word(word_normalized)
+            if cached_data:
+                logger.info(f"Cache HIT for word: {word_normalized}")
+                cached_data["_cache_status"] = "HIT"
+                return cached_data
 
-        logger.debug(f"Cache MISS for word: {word_normalized}")
+            logger.debug(f"Cache MISS for word: {word_normalized}")
 
-        # Step 2: Check database
-        word_model = await self.word_repository.get_by_word_text(
-            word_normalized,
-            eager_load=True
-        )
+        # Step 2: Check database (document assembled by PostgreSQL, no ORM objects)
+        word_data = await self.word_repository.get_word_data(word_normalized)
 
-        if word_model:
+        if word_data is not None:
             logger.info(f"Word found in database: {word_normalized}")
-            word_data = self._model_to_dict(word_model)
+            word_data["data_completeness"] = self.calculate_data_completeness(word_data)
             word_data["_cache_status"] = "MISS"
 
             # Cache the result
             frequency_rank = None
-            if word_model.learning_metadata:
-                frequency_rank = word_model.learning_metadata.frequency_rank
+            if word_data["learning_metadata"]:
+                frequency_rank = word_data["learning_metadata"]["frequency_rank"]
 
             await self.cache_service.set_cached_word(
                 word_normalized,
@@ -126,17 +181,21 @@ class WordService:
         except Exception as e:
             logger.error(f"Failed to store word '{word_normalized}' in database: {e}")
             await self.db.rollback()
-            # Still return the enriched data even if storage fails
+            # Still return the enriched data even if storage fails. It has not
+            # been through the model constraints, so flag it for validation.
             enriched_data["_cache_status"] = "MISS"
+            enriched_data["_storage_failed"] = True
             return enriched_data
 
-        # Step 6: Convert to dict and cache
-        word_data = self._model_to_dict(word_model)
+        # Step 6: Read the stored document back and cache it. The child rows
+        # were bulk inserted, so word_model has no relationships loaded.
+        word_data = await self.word_repository.get_word_data(word_model.word_text)
+        word_data["data_completeness"] = self.calculate_data_completeness(word_data)
         word_data["_cache_status"] = "MISS"
 
         frequency_rank = None
-        if word_model.learning_metadata:
-            frequency_rank = word_model.learning_metadata.frequency_rank
+        if word_data["learning_metadata"]:
+            frequency_rank = word_data["learning_metadata"]["frequency_rank"]
 
         await self.cache_service.set_cached_word(
             word_normalized,
@@ -179,7 +238,7 @@ class WordService:
         if enriched_data.get("grammatical_info"):
             gram_info = enriched_data["grammatical_info"]
             # Only include if there's meaningful data
-            if any(v for k, v in gram_info.items() if v):
+            if any(gram_info.values()):
                 grammatical_data = gram_info
 
         # Prepare learning metadata
@@ -187,7 +246,7 @@ class WordService:
         if enriched_data.get("learning_metadata"):
             metadata = enriched_data["learning_metadata"]
             # Only include if there's meaningful data
-            if any(v for k, v in metadata.items() if v):
+            if any(metadata.values()):
                 learning_metadata_data = metadata
 
         # Create word with all relations
@@ -201,8 +260,11 @@ class WordService:
             related_words_data=None  # Will be handled separately
         )
 
-        # Update last_enriched_at timestamp
-        word.last_enriched_at = datetime.utcnow()
+        # Update last_enriched_at timestamp (naive UTC, like the enrichment's own)
+        word.last_enriched_at = (
+            enriched_data.get("last_enriched_at")
+            or datetime.now(UTC).replace(tzinfo=None)
+        )
 
         # Note: Related words will be created in a separate process
         # to avoid circular dependencies (need both source and target words to exist)
@@ -211,98 +273,6 @@ class WordService:
 
         return word
 
-    def _model_to_dict(self, word: Word) -> Dict[str, Any]:
-        """
-        Convert Word model to dictionary for API response.
-
-        Args:
-            word: Word model instance
-
-        Returns:
-            Dictionary representation with all relationships
-        """
-        # Build phonetic data
-        phonetic = None
-        if word.phonetic:
-            phonetic = {
-                "ipa_transcription": word.phonetic.ipa_transcription,
-                "audio_url": word.phonetic.audio_url
-            }
-
-        # Build definitions with examples
-        definitions = []
-        for definition in word.definitions:
-            # Build examples with context_type
-            examples = []
-            for ex in definition.usage_examples:
-                examples.append({
-                    "example_text": ex.example_text,
-                    "context_type": ex.context_type
-                })
-
-            definitions.append({
-                "definition_text": definition.definition_text,
-                "part_of_speech": definition.part_of_speech,
-                "usage_context": definition.usage_context,
-                "examples": examples,
-                "order_index": definition.order_index
-            })
-
-        # Build grammatical info
-        grammatical_info = None
-        if word.grammatical_info:
-            gram = word.grammatical_info
-            grammatical_info = {
-                "part_of_speech": gram.part_of_speech,
-                "plural_form": gram.plural_form,
-                "verb_base": gram.verb_base,
-                "verb_past_simple": gram.verb_past_simple,
-                "verb_past_participle": gram.verb_past_participle,
-                "verb_present_participle": gram.verb_present_participle,
-                "verb_third_person": gram.verb_third_person,
-                "adj_comparative": gram.adj_comparative,
-                "adj_superlative": gram.adj_superlative,
-                "irregular_forms_json": gram.irregular_forms_json
-            }
-
-        # Build learning metadata
-        learning_metadata = None
-        if word.learning_metadata:
-            meta = word.learning_metadata
-            learning_metadata = {
-                "difficulty_level": meta.difficulty_level,
-                "cefr_level": meta.cefr_level,
-                "frequency_rank": meta.frequency_rank,
-                "frequency_band": meta.frequency_band,
-                "style_tags": meta.style_tags or []
-            }
-
-        # Build related words
-        related_words = []
-        for rel in word.related_words_source:
-            if rel.target_word:
-                related_words.append({
-                    "word": rel.target_word.word_text,
-                    "relationship_type": rel.relationship_type,
-                    "usage_notes": rel.usage_notes
-                })
-
-        # Calculate data completeness
-        word_dict = {
-            "word_text": word.word_text,
-            "language": word.language,
-            "phonetic": phonetic,
-            "definitions": definitions,
-            "grammatical_info": grammatical_info,
-            "learning_metadata": learning_metadata,
-            "related_words": related_words
-        }
-
-        completeness = self.calculate_data_completeness(word_dict)
-        word_dict["data_completeness"] = completeness
-
-        return word_dict
-
     def calculate_data_completeness(self, word_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Calculate data completeness metrics.
@@ -17,6 +17,12 @@ class WordNetAdapter(DataSourceAdapter):
     - Related words (hypernyms, hyponyms)
     """
 
+    # Fields this adapter can provide (see get_supported_fields)
+    supported_fields = ("synonyms", "antonyms", "related_words")
+
+    # Set form of supported_fields for supports_field lookups
+    _SUPPORTED = frozenset(supported_fields)
+
     def __init__(self):
         """Initialize WordNet adapter and ensure data is downloaded."""
         self._ensure_wordnet_data()
@@ -167,18 +173,4 @@ class WordNetAdapter(DataSourceAdapter):
         Returns:
             True if field is supported (synonyms, antonyms, related_words)
         """
-        supported_fields = {
-            "synonyms",
-            "antonyms",
-            "related_words",
-        }
-        return field in supported_fields
-
-    def get_supported_fields(self) -> list[str]:
-        """
-        Get list of all supported fields.
-
-        Returns:
-            List of field names this adapter can provide
-        """
-        return ["synonyms", "antonyms", "related_words"]
+        return field in self._SUPPORTED
@@ -0,0 +1,130 @@
+"""Unit tests for EnrichmentService - concurrent enrich_word calls share one enrichment."""
+import asyncio
+
+import pytest
+
+from src.services.enrichment_service import EnrichmentService
+
+
+class FakeClaudeAdapter:
+    """Claude adapter stand-in that blocks until released and counts calls."""
+
+    def __init__(self, error: Exception = None):
+        self.calls = 0
+        self.error = error
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def fetch_word_data(self, word: str) -> dict:
+        self.calls += 1
+        self.started.set()
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return {
+            "definitions": [
+                {
+                    "definition_text": "A feeling of great pleasure and contentment",
+                    "part_of_speech": "noun",
+                    "examples": []
+                }
+            ],
+            "grammatical_info": {"part_of_speech": "noun"},
+            "related_words": [],
+            "phonetic": None
+        }
+
+
+class TestSingleFlightEnrichment:
+    """Test that concurrent enrichments of one word share a single adapter call."""
+
+    @pytest.fixture
+    def enrichment_service(self):
+        """Create EnrichmentService instance for testing."""
+        return EnrichmentService()
+
+    async def test_concurrent_callers_share_one_adapter_call(self, enrichment_service):
+        """Test that two concurrent callers trigger one Claude call."""
+        fake_claude = FakeClaudeAdapter()
+        enrichment_service.claude_adapter = fake_claude
+
+        first = asyncio.ensure_future(enrichment_service.enrich_word("joy"))
+        second = asyncio.ensure_future(enrichment_service.enrich_word("joy"))
+        await fake_claude.started.wait()
+        assert "joy" in enrichment_service._inflight
+
+        fake_claude.release.set()
+        first_result, second_result = await asyncio.gather(first, second)
+
+        assert fake_claude.calls == 1
+        assert first_result == second_result
+        assert first_result["word_text"] == "joy"
+        assert enrichment_service._inflight == {}
+
+    async def test_cancelling_one_caller_does_not_cancel_the_other(self, enrichment_service):
+        """Test that a cancelled caller leaves the shared enrichment running."""
+        fake_claude = FakeClaudeAdapter()
+        enrichment_service.claude_adapter = fake_claude
+
+        first = asyncio.ensure_future(enrichment_service.enrich_word("joy"))
+        second = asyncio.ensure_future(enrichment_service.enrich_word("joy"))
+        await fake_claude.started.wait()
+
+        first.cancel()
+        await asyncio.gather(first, return_exceptions=True)
+        assert first.cancelled()
+
+        fake_claude.release.set()
+        result = await second
+
+        assert result["word_text"] == "joy"
+        assert fake_claude.calls == 1
+        assert enrichment_service._inflight == {}
+
+    async def test_failure_reaches_every_waiter(self, enrichment_service):
+        """Test that an adapter failure is raised to all callers and clears _inflight."""
+        fake_claude = FakeClaudeAdapter(error=RuntimeError("Claude API error"))
+        enrichment_service.claude_adapter = fake_claude
+
+        callers = [
+            asyncio.ensure_future(enrichment_service.enrich_word("joy"))
+            for _ in range(3)
+        ]
+        await fake_claude.started.wait()
+        fake_claude.release.set()
+        results = await asyncio.gather(*callers, return_exceptions=True)
+
+        assert fake_claude.calls == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert enrichment_service._inflight == {}
+
+        # A failure is not cached, so the next call retries
+        fake_claude.error = None
+        result = await enrichment_service.enrich_word("joy")
+        assert result["word_text"] == "joy"
+        assert fake_claude.calls == 2
+
+    async def test_callers_get_independent_copies(self, enrichment_service):
+        """Test that mutating one caller's result does not affect another's."""
+        fake_claude = FakeClaudeAdapter()
+        enrichment_service.claude_adapter = fake_claude
+
+        first = asyncio.ensure_future(enrichment_service.enrich_word("joy"))
+        second = asyncio.ensure_future(enrichment_service.enrich_word("joy"))
+        await fake_claude.started.wait()
+        fake_claude.release.set()
+        first_result, second_result = await asyncio.gather(first, second)
+
+        assert first_result is not second_result
+        assert first_result["definitions"] is not second_result["definitions"]
+
+        first_result["_cache_status"] = "MISS"
+        first_result["definitions"][0]["definition_text"] = "changed"
+
+        assert "_cache_status" not in second_result
+        assert second_result["definitions"][0]["definition_text"] != "changed"
+
+        cached_result = await enrichment_service.enrich_word("joy")
+        assert "_cache_status" not in cached_result
+        assert cached_result["definitions"][0]["definition_text"] != "changed"
+        assert fake_claude.calls == 1
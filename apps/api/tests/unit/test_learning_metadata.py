@@ -0,0 +1,89 @@
+"""Unit tests for the LearningMetadata style tag bitmask."""
+from itertools import combinations
+from unittest.mock import patch
+
+import pytest
+
+from src.models.learning_metadata import (
+    STYLE_TAG_BITS,
+    STYLE_TAGS,
+    LearningMetadata,
+    decode_style_tags,
+    encode_style_tags,
+)
+from src.repositories.word_repository import _STYLE_TAGS_SQL
+
+SMALLINT_MAX = 2 ** 15 - 1
+
+
+class TestStyleTagCodec:
+    """Test encoding and decoding style tags to and from style_tag_mask."""
+
+    @pytest.mark.parametrize("tag", STYLE_TAGS)
+    def test_single_tag_round_trips(self, tag):
+        """Test that every tag encodes to its own bit and decodes back."""
+        mask = encode_style_tags([tag])
+        assert mask == STYLE_TAG_BITS[tag]
+        assert bin(mask).count("1") == 1
+        assert decode_style_tags(mask) == [tag]
+
+    def test_every_combination_round_trips_in_vocabulary_order(self):
+        """Test that any set of tags decodes to the same tags, in STYLE_TAGS order."""
+        for size in range(len(STYLE_TAGS) + 1):
+            for tags in combinations(STYLE_TAGS, size):
+                expected = list(tags)
+                assert decode_style_tags(encode_style_tags(tags)) == expected
+                assert decode_style_tags(encode_style_tags(reversed(tags))) == expected
+
+    def test_duplicate_tags_are_stored_once(self):
+        """Test that repeating a tag does not change the mask."""
+        assert encode_style_tags(["formal", "formal"]) == encode_style_tags(["formal"])
+
+    def test_unknown_tags_are_dropped_with_a_warning(self):
+        """Test that tags outside the vocabulary are ignored when encoding, and logged."""
+        with patch("src.models.learning_metadata.logger") as mock_logger:
+            assert encode_style_tags(["poetic"]) == 0
+            assert decode_style_tags(encode_style_tags(["poetic", "slang", "Formal"])) == ["slang"]
+
+        warned = [call.args[0] for call in mock_logger.warning.call_args_list]
+        assert len(warned) == 3
+        assert "'poetic'" in warned[0] and "'Formal'" in warned[2]
+
+    def test_known_tags_are_not_logged(self):
+        """Test that encoding only known tags logs nothing."""
+        with patch("src.models.learning_metadata.logger") as mock_logger:
+            encode_style_tags(STYLE_TAGS)
+        mock_logger.warning.assert_not_called()
+
+    def test_empty_and_missing_tags(self):
+        """Test that no tags encode to 0 and 0 decodes to no tags."""
+        assert encode_style_tags(None) == 0
+        assert encode_style_tags([]) == 0
+        assert decode_style_tags(0) == []
+
+    def test_unknown_bits_are_ignored_when_decoding(self):
+        """Test that bits past the vocabulary decode to nothing."""
+        all_tags_mask = encode_style_tags(STYLE_TAGS)
+        assert decode_style_tags(1 << len(STYLE_TAGS)) == []
+        assert decode_style_tags(all_tags_mask | 1 << len(STYLE_TAGS)) == list(STYLE_TAGS)
+
+    def test_all_tags_fit_in_smallint(self):
+        """Test that the mask with every tag set fits the SMALLINT column."""
+        all_tags_mask = encode_style_tags(STYLE_TAGS)
+        assert all_tags_mask == 2 ** len(STYLE_TAGS) - 1
+        assert all_tags_mask <= SMALLINT_MAX
+
+    def test_sql_decoding_uses_the_same_bits(self):
+        """Test that the SQL array matches STYLE_TAGS, so ordinal N is bit 1 << (N - 1)."""
+        sql_tags = _STYLE_TAGS_SQL.removeprefix("ARRAY[").removesuffix("]").split(", ")
+        assert sql_tags == [f"'{tag}'" for tag in STYLE_TAGS]
+        for ordinal, tag in enumerate(STYLE_TAGS, start=1):
+            assert STYLE_TAG_BITS[tag] == 1 << (ordinal - 1)
+
+    def test_model_property_round_trips(self):
+        """Test the LearningMetadata.style_tags property over style_tag_mask."""
+        metadata = LearningMetadata(style_tag_mask=0)
+        with patch("src.models.learning_metadata.logger"):
+            metadata.style_tags = ["technical", "formal", "unknown"]
+        assert metadata.style_tag_mask == STYLE_TAG_BITS["formal"] | STYLE_TAG_BITS["technical"]
+        assert metadata.style_tags == ["formal", "technical"]
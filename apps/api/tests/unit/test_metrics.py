@@ -0,0 +1,106 @@
+"""Unit tests for buffered histogram observations."""
+import pytest
+from prometheus_client import CollectorRegistry, Histogram
+
+from src.api.middleware.metrics import HistogramBuffer
+
+
+class TestHistogramBuffer:
+    """Test HistogramBuffer against a histogram on a private registry."""
+
+    @pytest.fixture
+    def registry(self):
+        """Registry isolated from the application's default metrics."""
+        return CollectorRegistry()
+
+    @pytest.fixture
+    def histogram(self, registry):
+        """Labelled histogram registered on the private registry."""
+        return Histogram(
+            "test_request_duration_seconds",
+            "Test request latency in seconds",
+            ["method", "endpoint"],
+            registry=registry
+        )
+
+    @pytest.fixture
+    def buffer(self, histogram):
+        """Buffer in front of the test histogram."""
+        return HistogramBuffer(histogram)
+
+    def sample(self, registry, suffix, method, endpoint, **extra_labels):
+        """Read one sample of the test histogram (None if it has no child yet)."""
+        return registry.get_sample_value(
+            f"test_request_duration_seconds_{suffix}",
+            {"method": method, "endpoint": endpoint, **extra_labels}
+        )
+
+    def test_observe_is_buffered_until_flush(self, registry, buffer):
+        """Test that observations only reach the histogram on flush."""
+        buffer.observe(("GET", "/words"), 0.2)
+        assert self.sample(registry, "count", "GET", "/words") is None
+
+        buffer.flush()
+        assert self.sample(registry, "count", "GET", "/words") == 1
+        assert self.sample(registry, "sum", "GET", "/words") == pytest.approx(0.2)
+
+    def test_observations_reach_their_label_child(self, registry, buffer):
+        """Test that each observation lands on the child for its labels."""
+        buffer.observe(("GET", "/words"), 0.1)
+        buffer.observe(("POST", "/words"), 2.0)
+        buffer.observe(("GET", "/words"), 0.3)
+        buffer.observe(("GET", "/health"), 0.004)
+        buffer.flush()
+
+        assert self.sample(registry, "count", "GET", "/words") == 2
+        assert self.sample(registry, "sum", "GET", "/words") == pytest.approx(0.4)
+        assert self.sample(registry, "count", "POST", "/words") == 1
+        assert self.sample(registry, "sum", "POST", "/words") == pytest.approx(2.0)
+        assert self.sample(registry, "count", "GET", "/health") == 1
+        # Buckets are per child too
+        assert self.sample(registry, "bucket", "GET", "/health", le="0.005") == 1
+        assert self.sample(registry, "bucket", "GET", "/words", le="0.005") == 0
+        assert self.sample(registry, "bucket", "POST", "/words", le="1.0") == 0
+
+    def test_flush_empties_the_buffer(self, registry, buffer):
+        """Test that observations are applied exactly once across flushes."""
+        buffer.observe(("GET", "/words"), 0.1)
+        buffer.flush()
+        buffer.flush()
+        assert self.sample(registry, "count", "GET", "/words") == 1
+
+        buffer.observe(("GET", "/words"), 0.1)
+        buffer.flush()
+        assert self.sample(registry, "count", "GET", "/words") == 2
+
+    def test_flush_with_nothing_pending(self, registry, buffer):
+        """Test that flushing an empty buffer creates no children."""
+        buffer.flush()
+        assert self.sample(registry, "count", "GET", "/words") is None
+
+    def test_max_pending_flushes_inline(self, registry, buffer):
+        """Test that reaching MAX_PENDING applies the buffer without an explicit flush."""
+        buffer.MAX_PENDING = 3
+
+        buffer.observe(("GET", "/words"), 0.1)
+        buffer.observe(("POST", "/words"), 0.1)
+        assert self.sample(registry, "count", "GET", "/words") is None
+
+        buffer.observe(("GET", "/words"), 0.1)
+        assert self.sample(registry, "count", "GET", "/words") == 2
+        assert self.sample(registry, "count", "POST", "/words") == 1
+
+        # The pending count starts over after the inline flush
+        buffer.observe(("GET", "/words"), 0.1)
+        buffer.observe(("GET", "/words"), 0.1)
+        assert self.sample(registry, "count", "GET", "/words") == 2
+        buffer.observe(("GET", "/words"), 0.1)
+        assert self.sample(registry, "count", "GET", "/words") == 5
+
+    def test_default_max_pending_bounds_the_buffer(self, registry, buffer):
+        """Test that the default cap is enforced without an explicit flush."""
+        for _ in range(HistogramBuffer.MAX_PENDING):
+            buffer.observe(("GET", "/words"), 0.01)
+
+        assert self.sample(registry, "count", "GET", "/words") == HistogramBuffer.MAX_PENDING
+        assert buffer._pending == {}
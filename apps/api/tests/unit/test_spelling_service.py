@@ -0,0 +1,295 @@
+"""Unit tests for SpellingService and its BK-tree word index."""
+import random
+import string
+
+import pytest
+
+from src.services.spelling_service import SpellingService, _BKTree, _char_signature
+
+
+def reference_distance(s1: str, s2: str) -> int:
+    """Plain full-matrix Levenshtein distance, used as the oracle."""
+    matrix = [[0] * (len(s2) + 1) for _ in range(len(s1) + 1)]
+    for i in range(len(s1) + 1):
+        matrix[i][0] = i
+    for j in range(len(s2) + 1):
+        matrix[0][j] = j
+    for i in range(1, len(s1) + 1):
+        for j in range(1, len(s2) + 1):
+            cost = 0 if s1[i - 1] == s2[j - 1] else 1
+            matrix[i][j] = min(
+                matrix[i - 1][j] + 1,
+                matrix[i][j - 1] + 1,
+                matrix[i - 1][j - 1] + cost
+            )
+    return matrix[len(s1)][len(s2)]
+
+
+def brute_force_search(words, word, max_distance):
+    """Every (word, distance) pair within max_distance, by scanning all words."""
+    return sorted(
+        (candidate, distance)
+        for candidate in set(words)
+        if (distance := reference_distance(word, candidate)) <= max_distance
+    )
+
+
+def brute_force_suggestions(words, word, max_distance, max_suggestions):
+    """What suggest_similar_words should return, by scanning all words."""
+    if not word:
+        return []
+    word_lower = word.lower()
+    matches = [
+        (candidate, distance)
+        for candidate, distance in brute_force_search(words, word_lower, max_distance)
+        if distance > 0
+    ]
+    matches.sort(key=lambda x: (x[1], x[0]))
+    return [candidate for candidate, _ in matches[:max_suggestions]]
+
+
+def mutate(word, rng, alphabet, edits):
+    """Apply a few random insertions, deletions and substitutions to a word."""
+    chars = list(word)
+    for _ in range(edits):
+        position = rng.randint(0, len(chars))
+        operation = rng.randint(0, 2)
+        if operation == 0:
+            chars.insert(position, rng.choice(alphabet))
+        elif chars and operation == 1:
+            chars.pop(min(position, len(chars) - 1))
+        elif chars:
+            chars[min(position, len(chars) - 1)] = rng.choice(alphabet)
+    return "".join(chars)
+
+
+# Words beyond a-z: accented Latin, German sharp s, Cyrillic and CJK
+NON_ASCII_WORDS = ["café", "cafe", "naïve", "naive", "straße", "strasse", "слово", "слова", "日本", "日本語"]
+
+
+class TestLevenshteinDistance:
+    """Test exact and bounded Levenshtein distance."""
+
+    @pytest.fixture
+    def spelling_service(self):
+        """Create SpellingService instance for testing."""
+        return SpellingService()
+
+    @pytest.mark.parametrize("s1,s2,expected", [
+        ("", "", 0),
+        ("", "abc", 3),
+        ("abc", "", 3),
+        ("kitten", "kitten", 0),
+        ("kitten", "sitting", 3),
+        ("sitting", "kitten", 3),
+        ("flaw", "lawn", 2),
+        ("receive", "recieve", 2),
+        ("a", "abcdefgh", 7),
+        ("abcdefgh", "h", 7),
+        ("café", "cafe", 1),
+        ("日本", "日本語", 1),
+    ])
+    def test_exact_distance_without_bound(self, spelling_service, s1, s2, expected):
+        """Test that bound=None returns the exact distance."""
+        assert spelling_service._levenshtein_distance(s1, s2) == expected
+        assert spelling_service._levenshtein_distance(s1, s2, None) == expected
+
+    @pytest.mark.parametrize("s1,s2,bound,expected", [
+        # Within the bound: exact distance
+        ("kitten", "sitting", 3, 3),
+        ("kitten", "sitting", 5, 3),
+        ("flaw", "lawn", 2, 2),
+        ("same", "same", 0, 0),
+        ("", "ab", 2, 2),
+        # Past the bound: bound + 1
+        ("kitten", "sitting", 2, 3),
+        ("kitten", "sitting", 0, 1),
+        ("flaw", "lawn", 1, 2),
+        ("abcdef", "ghijkl", 2, 3),
+        # Length difference alone exceeds the bound
+        ("a", "abcdefgh", 2, 3),
+        ("abcdefgh", "a", 0, 1),
+        ("", "abcd", 2, 3),
+        ("abcd", "", 3, 4),
+        # Equal lengths but every row ends past the bound (early exit)
+        ("aaaaaaaa", "bbbbbbbb", 1, 2),
+    ])
+    def test_bounded_distance(self, spelling_service, s1, s2, bound, expected):
+        """Test that a bound returns the exact distance, or bound + 1 past it."""
+        assert spelling_service._levenshtein_distance(s1, s2, bound) == expected
+
+    def test_bounded_matches_exact_on_random_pairs(self, spelling_service):
+        """Test that every bound gives min(exact distance, bound + 1)."""
+        rng = random.Random(3)
+        for _ in range(2000):
+            s1 = "".join(rng.choices("abc", k=rng.randint(0, 8)))
+            s2 = "".join(rng.choices("abc", k=rng.randint(0, 8)))
+            exact = reference_distance(s1, s2)
+            assert spelling_service._levenshtein_distance(s1, s2) == exact
+            for bound in range(6):
+                assert spelling_service._levenshtein_distance(s1, s2, bound) == min(
+                    exact, bound + 1
+                ), (s1, s2, bound)
+
+
+class TestBKTreeSearch:
+    """Test BK-tree range queries against a brute-force scan."""
+
+    @pytest.fixture
+    def spelling_service(self):
+        """Create SpellingService instance for testing."""
+        return SpellingService()
+
+    def build_tree(self, spelling_service, words):
+        """Build a BK-tree over words with the service's distance function."""
+        tree = _BKTree(spelling_service._levenshtein_distance)
+        for word in words:
+            tree.add(word)
+        return tree
+
+    def test_empty_tree_returns_nothing(self, spelling_service):
+        """Test that searching an empty tree finds no words."""
+        tree = _BKTree(spelling_service._levenshtein_distance)
+        assert tree.search("word", 2) == []
+
+    def test_duplicate_words_are_stored_once(self, spelling_service):
+        """Test that adding a word twice does not duplicate it in results."""
+        tree = self.build_tree(spelling_service, ["cat", "cat", "bat"])
+        assert sorted(tree.search("cat", 1)) == [("bat", 1), ("cat", 0)]
+
+    def test_matches_brute_force_on_random_words(self, spelling_service):
+        """Test that search finds exactly the words a full scan finds."""
+        rng = random.Random(1)
+        alphabet = "abcdeo"
+        words = ["".join(rng.choices(alphabet, k=rng.randint(1, 8))) for _ in range(300)]
+        tree = self.build_tree(spelling_service, words)
+
+        for _ in range(100):
+            query = mutate(rng.choice(words), rng, alphabet, rng.randint(0, 3))
+            for max_distance in (0, 1, 2, 3):
+                assert sorted(tree.search(query, max_distance)) == brute_force_search(
+                    words, query, max_distance
+                ), (query, max_distance)
+
+    def test_empty_strings(self, spelling_service):
+        """Test that the empty string works both as a stored word and as a query."""
+        words = ["", "a", "ab", "abc", "abcd"]
+        tree = self.build_tree(spelling_service, words)
+
+        for max_distance in (0, 1, 2, 3):
+            assert sorted(tree.search("", max_distance)) == brute_force_search(
+                words, "", max_distance
+            )
+            assert sorted(tree.search("ab", max_distance)) == brute_force_search(
+                words, "ab", max_distance
+            )
+
+    def test_non_ascii_words(self, spelling_service):
+        """Test that words outside a-z are indexed and found correctly."""
+        tree = self.build_tree(spelling_service, NON_ASCII_WORDS)
+
+        for query in NON_ASCII_WORDS + ["caf", "naïv", "strase", "слов", "日"]:
+            for max_distance in (0, 1, 2):
+                assert sorted(tree.search(query, max_distance)) == brute_force_search(
+                    NON_ASCII_WORDS, query, max_distance
+                ), (query, max_distance)
+
+    def test_characters_sharing_signature_bits(self, spelling_service):
+        """Test pruning when different characters map to the same signature bit."""
+        # ord & 63 maps a, á and ! to one bit, and d, ä and $ to another
+        assert _char_signature("a") == _char_signature("á") == _char_signature("!")
+        assert _char_signature("d") == _char_signature("ä") == _char_signature("$")
+
+        rng = random.Random(11)
+        alphabet = "aá!dä$ab"
+        words = ["".join(rng.choices(alphabet, k=rng.randint(0, 6))) for _ in range(200)]
+        tree = self.build_tree(spelling_service, words)
+
+        for _ in range(100):
+            query = mutate(rng.choice(words), rng, alphabet, rng.randint(0, 3))
+            for max_distance in (0, 1, 2):
+                assert sorted(tree.search(query, max_distance)) == brute_force_search(
+                    words, query, max_distance
+                ), (query, max_distance)
+
+    def test_signature_lower_bound_never_exceeds_distance(self):
+        """Test that the signature bound used for pruning is a true lower bound."""
+        rng = random.Random(5)
+        alphabet = "abcaá!dä$é%"
+        for _ in range(2000):
+            s1 = "".join(rng.choices(alphabet, k=rng.randint(0, 7)))
+            s2 = "".join(rng.choices(alphabet, k=rng.randint(0, 7)))
+            signature1, signature2 = _char_signature(s1), _char_signature(s2)
+            lower_bound = max(
+                (signature1 & ~signature2).bit_count(),
+                (signature2 & ~signature1).bit_count()
+            )
+            assert lower_bound <= reference_distance(s1, s2), (s1, s2)
+
+    def test_max_distance_zero_finds_only_exact_match(self, spelling_service):
+        """Test that max_distance=0 returns the word itself or nothing."""
+        words = ["cat", "bat", "cats", "act"]
+        tree = self.build_tree(spelling_service, words)
+
+        assert tree.search("cat", 0) == [("cat", 0)]
+        assert tree.search("cst", 0) == []
+
+
+class TestSuggestSimilarWords:
+    """Test spelling suggestions against a brute-force scan."""
+
+    @pytest.fixture
+    def spelling_service(self):
+        """Create SpellingService instance for testing."""
+        return SpellingService()
+
+    def test_common_misspellings(self, spelling_service):
+        """Test suggestions for typical misspellings of common words."""
+        assert spelling_service.suggest_similar_words("recive")[0] == "receive"
+        assert spelling_service.suggest_similar_words("beautifull")[0] == "beautiful"
+        assert spelling_service.suggest_similar_words("serendipty")[0] == "serendipity"
+
+    def test_matches_brute_force(self, spelling_service):
+        """Test that suggestions match a full scan of the word list."""
+        rng = random.Random(7)
+        words = sorted(spelling_service.common_words)
+
+        for _ in range(100):
+            query = mutate(rng.choice(words), rng, string.ascii_lowercase, rng.randint(0, 3))
+            for max_distance in (0, 1, 2, 3):
+                assert spelling_service.suggest_similar_words(
+                    query, max_distance, 3
+                ) == brute_force_suggestions(words, query, max_distance, 3), (query, max_distance)
+
+    def test_empty_word_returns_no_suggestions(self, spelling_service):
+        """Test that an empty query has no suggestions."""
+        assert spelling_service.suggest_similar_words("") == []
+
+    def test_max_distance_zero_returns_no_suggestions(self, spelling_service):
+        """Test that max_distance=0 never suggests (exact matches are excluded)."""
+        assert spelling_service.suggest_similar_words("happy", max_distance=0) == []
+        assert spelling_service.suggest_similar_words("hapy", max_distance=0) == []
+
+    def test_query_is_case_insensitive(self, spelling_service):
+        """Test that uppercase queries get the same suggestions."""
+        assert spelling_service.suggest_similar_words("HAPY") == (
+            spelling_service.suggest_similar_words("hapy")
+        )
+
+    def test_add_word_to_dictionary(self, spelling_service):
+        """Test that added words are suggested and match a full scan."""
+        assert "quokka" not in spelling_service.suggest_similar_words("quoka")
+
+        for word in ["Quokka", "café", "naïve"]:
+            spelling_service.add_word_to_dictionary(word)
+        spelling_service.add_word_to_dictionary("")
+
+        words = sorted(spelling_service.common_words)
+        assert "quokka" in words
+        assert "" not in words
+
+        for query in ["quoka", "quokkas", "cafe", "naive", "naïv"]:
+            for max_distance in (0, 1, 2):
+                assert spelling_service.suggest_similar_words(
+                    query, max_distance, 5
+                ) == brute_force_suggestions(words, query, max_distance, 5), (query, max_distance)
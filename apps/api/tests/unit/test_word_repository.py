@@ -0,0 +1,196 @@
+"""Unit tests for WordRepository - the word document built by WORD_DATA_QUERY."""
+import os
+import re
+
+import pytest
+
+from src.repositories.word_repository import WORD_DATA_QUERY, WordRepository
+
+# Keys of the word document, in the order json_build_object emits them
+# (nested objects are listed in place, depth first)
+EXPECTED_KEY_ORDER = [
+    "word_text",
+    "language",
+    "phonetic",
+    "ipa_transcription", "audio_url",
+    "definitions",
+    "definition_text", "part_of_speech", "usage_context",
+    "examples",
+    "example_text", "context_type",
+    "order_index",
+    "grammatical_info",
+    "part_of_speech", "plural_form", "verb_base", "verb_past_simple",
+    "verb_past_participle", "verb_present_participle", "verb_third_person",
+    "adj_comparative", "adj_superlative", "irregular_forms_json",
+    "learning_metadata",
+    "difficulty_level", "cefr_level", "frequency_rank", "frequency_band", "style_tags",
+    "related_words",
+    "word", "relationship_type", "usage_notes",
+]
+
+TOP_LEVEL_KEYS = [
+    "word_text", "language", "phonetic", "definitions",
+    "grammatical_info", "learning_metadata", "related_words",
+]
+
+
+class TestWordDataQueryShape:
+    """Test the document shape declared by WORD_DATA_QUERY."""
+
+    @pytest.fixture
+    def sql(self):
+        """WORD_DATA_QUERY's SQL text."""
+        return WORD_DATA_QUERY.text
+
+    def test_keys_and_order(self, sql):
+        """Test that every key is emitted, in the documented order."""
+        assert re.findall(r"^\s*'(\w+)',", sql, re.MULTILINE) == EXPECTED_KEY_ORDER
+
+    def test_lists_default_to_empty_json_arrays(self, sql):
+        """Test that list fields are '[]' rather than null when there are no rows."""
+        for key in ("definitions", "examples", "related_words"):
+            assert re.search(rf"'{key}', COALESCE\(\(", sql), key
+        assert sql.count("'[]'::json)") == 4  # definitions, examples, style_tags, related_words
+
+    def test_one_to_one_rows_are_null_when_missing(self, sql):
+        """Test that phonetic, grammatical info and learning metadata are plain subqueries."""
+        for key in ("phonetic", "grammatical_info", "learning_metadata"):
+            assert re.search(rf"'{key}', \(\s*SELECT json_build_object\(", sql), key
+
+    def test_definitions_and_examples_sorted_by_order_index(self, sql):
+        """Test that definitions and examples are aggregated in order_index order."""
+        assert ") ORDER BY d.order_index)" in sql
+        assert ") ORDER BY e.order_index)" in sql
+
+
+@pytest.mark.skipif(
+    not os.environ.get("TEST_DATABASE_URL"),
+    reason="set TEST_DATABASE_URL to a disposable PostgreSQL database to run"
+)
+class TestGetWordDataAgainstDatabase:
+    """Test get_word_data against PostgreSQL (creates and drops all tables)."""
+
+    @pytest.fixture
+    async def db_session(self):
+        """Session on a freshly created schema, dropped afterwards."""
+        from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+        from sqlalchemy.pool import NullPool
+
+        from src.models import Base
+        from src.models.learning_metadata import CEFR_LEVEL_ENUM, FREQUENCY_BAND_ENUM
+
+        engine = create_async_engine(os.environ["TEST_DATABASE_URL"], poolclass=NullPool)
+
+        def create_schema(connection):
+            CEFR_LEVEL_ENUM.create(connection, checkfirst=True)
+            FREQUENCY_BAND_ENUM.create(connection, checkfirst=True)
+            Base.metadata.create_all(connection)
+
+        def drop_schema(connection):
+            Base.metadata.drop_all(connection)
+            CEFR_LEVEL_ENUM.drop(connection, checkfirst=True)
+            FREQUENCY_BAND_ENUM.drop(connection, checkfirst=True)
+
+        async with engine.begin() as connection:
+            await connection.run_sync(create_schema)
+        try:
+            async with AsyncSession(engine, expire_on_commit=False) as session:
+                yield session
+        finally:
+            async with engine.begin() as connection:
+                await connection.run_sync(drop_schema)
+            await engine.dispose()
+
+    async def test_full_document(self, db_session):
+        """Test a word with every relation, stored out of order."""
+        from sqlalchemy import insert, select
+
+        from src.models import uuid7
+        from src.models.definition import Definition
+        from src.models.usage_example import UsageExample
+
+        repository = WordRepository(db_session)
+        word = await repository.create_word_with_all_relations(
+            word_text="run",
+            phonetic_data={"ipa_transcription": "/rʌn/"},
+            definitions_data=[
+                {
+                    "definition_text": "Second meaning, stored first",
+                    "part_of_speech": "noun",
+                    "order_index": 2,
+                },
+                {
+                    "definition_text": "First meaning, stored second",
+                    "part_of_speech": "verb",
+                    "usage_context": "everyday",
+                    "order_index": 1,
+                },
+            ],
+            grammatical_data={"part_of_speech": "verb", "verb_past_simple": "ran"},
+            learning_metadata_data={
+                "cefr_level": "A1",
+                "frequency_rank": 90,
+                "style_tags": ["technical", "formal"],
+            },
+        )
+        # Examples stored in the reverse of their order_index
+        first_definition_id = (await db_session.execute(
+            select(Definition.id).where(Definition.order_index == 1)
+        )).scalar_one()
+        await db_session.execute(insert(UsageExample.__table__), [
+            {
+                "id": uuid7(),
+                "definition_id": first_definition_id,
+                "example_text": "I run daily.",
+                "context_type": "casual",
+                "order_index": 2,
+            },
+            {
+                "id": uuid7(),
+                "definition_id": first_definition_id,
+                "example_text": "Run for it!",
+                "context_type": None,
+                "order_index": 1,
+            },
+        ])
+        await db_session.commit()
+
+        word_data = await repository.get_word_data(word.word_text)
+
+        assert list(word_data) == TOP_LEVEL_KEYS
+        assert word_data["phonetic"] == {"ipa_transcription": "/rʌn/", "audio_url": None}
+        assert [d["order_index"] for d in word_data["definitions"]] == [1, 2]
+        first, second = word_data["definitions"]
+        assert list(first) == [
+            "definition_text", "part_of_speech", "usage_context", "examples", "order_index"
+        ]
+        assert [e["example_text"] for e in first["examples"]] == ["Run for it!", "I run daily."]
+        assert list(first["examples"][0]) == ["example_text", "context_type"]
+        assert second["examples"] == []
+        assert word_data["grammatical_info"]["verb_past_simple"] == "ran"
+        assert list(word_data["learning_metadata"]) == [
+            "difficulty_level", "cefr_level", "frequency_rank", "frequency_band", "style_tags"
+        ]
+        assert word_data["learning_metadata"]["style_tags"] == ["formal", "technical"]
+        assert word_data["related_words"] == []
+
+    async def test_missing_relations(self, db_session):
+        """Test that missing one-to-one rows are null and missing lists are empty."""
+        repository = WordRepository(db_session)
+        await repository.create_word_with_all_relations(word_text="bare")
+        await db_session.commit()
+
+        assert await repository.get_word_data("bare") == {
+            "word_text": "bare",
+            "language": "en",
+            "phonetic": None,
+            "definitions": [],
+            "grammatical_info": None,
+            "learning_metadata": None,
+            "related_words": [],
+        }
+
+    async def test_unknown_word(self, db_session):
+        """Test that an unknown word returns None."""
+        repository = WordRepository(db_session)
+        assert await repository.get_word_data("missing") is None